@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
+from typing import Any
 
 from app.core.chat_history import ChatMessage
 
-try:
-    from markdown_pdf import MarkdownPdf, Section
-except ImportError:  # pragma: no cover - exercised when dependency is missing
-    MarkdownPdf = None
-    Section = None
+
+@functools.cache
+def _load_markdown_pdf() -> tuple[Any, Any] | None:
+    """Import markdown-pdf on first export; it pulls in PyMuPDF and is slow to load."""
+
+    try:
+        from markdown_pdf import MarkdownPdf, Section
+    except ImportError:  # pragma: no cover - exercised when dependency is missing
+        return None
+    return MarkdownPdf, Section
 
 
 def _render_pdf_bytes(title: str, markdown_body: str) -> bytes:
     """Render markdown text into PDF bytes using markdown-pdf."""
 
-    if MarkdownPdf is None or Section is None:
+    markdown_pdf = _load_markdown_pdf()
+    if markdown_pdf is None:
         raise RuntimeError(
             "PDF export dependency missing. Install with `pip install markdown-pdf`."
         )
+    MarkdownPdf, Section = markdown_pdf
 
     body = markdown_body.strip() or "_No content._"
     document_markdown = f"# {title}\n\n{body}\n"
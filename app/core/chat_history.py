@@ -8,7 +8,7 @@ from dataclasses import dataclass
 _STATE_KEY = "chat_history"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     """Single chat message with a role and text content."""
 
@@ -39,19 +39,21 @@ def append_chat_message(
     messages.append(ChatMessage(role=role, content=content, message_type=message_type))
 
 
+def compute_trim_start(messages: list[ChatMessage], max_chars: int) -> int:
+    """Return the index of the oldest message that fits within max_chars."""
+
+    # Treat negative limits as zero to avoid confusing behavior.
+    budget = max(max_chars, 0)
+    # Walk back from the newest message so cost scales with the kept window.
+    start = len(messages)
+    while start > 0 and len(messages[start - 1].content) <= budget:
+        budget -= len(messages[start - 1].content)
+        start -= 1
+    return start
+
+
 def trim_chat_history(messages: list[ChatMessage], max_chars: int) -> None:
     """Trim oldest messages until the total content length is within max_chars."""
 
-    # Treat negative limits as zero to avoid confusing behavior.
-    if max_chars < 0:
-        max_chars = 0
-
-    # Count total content length so we know if trimming is required.
-    total_chars = sum(len(message.content) for message in messages)
-    if total_chars <= max_chars:
-        return
-
-    # Remove oldest messages until we are under the allowed character budget.
-    while messages and total_chars > max_chars:
-        total_chars -= len(messages[0].content)
-        messages.pop(0)
+    # Remove the whole over-budget prefix in one slice deletion.
+    del messages[: compute_trim_start(messages, max_chars)]
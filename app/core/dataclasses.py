@@ -10,7 +10,7 @@ from app.core.model_catalog import DEFAULT_MODEL
 
 
 # Immutable payload container keeps request data consistent across layers.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestPayload:
     """Inputs required to generate interview questions."""
 
@@ -24,7 +24,7 @@ class RequestPayload:
 
 
 # Immutable variant container avoids accidental prompt mutation.
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptVariant:
     """System prompt variant metadata and content."""
 
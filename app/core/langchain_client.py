@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable
 
 from app.core.dataclasses import RequestPayload
 from app.core.model_catalog import (
     DEFAULT_MODEL,
     get_reasoning_effort_options,
+    get_model_class,
     is_gpt5_model,
 )
 from app.core.orchestration import _parse_structured_output as parse_structured_output
@@ -25,7 +27,7 @@ from app.core.safety import (
     validate_inputs,
     validate_output,
 )
-from app.core.structured_output import STRUCTURED_OUTPUT_SCHEMA
+from app.core.structured_output import get_response_format
 
 _DOTENV_LOADED = False
 
@@ -95,9 +97,7 @@ def _resolve_reasoning_effort(
     selected_model: str, requested: str | None
 ) -> str | None:
     # Skip reasoning effort unless the model supports it.
-    if not requested or not is_gpt5_model(selected_model):
-        return None
-    if selected_model == "gpt-5.2-chat-latest":
+    if not requested or get_model_class(selected_model) != "gpt5_reasoning":
         return None
     allowed = get_reasoning_effort_options(selected_model)
     if allowed and requested not in allowed:
@@ -189,6 +189,26 @@ def _extract_refusal(response: object) -> str | None:
     return None
 
 
+def _stream_response(
+    llm: object,
+    messages: list[object],
+    on_delta: Callable[[str], None],
+) -> object:
+    """Stream a LangChain response, forwarding text deltas and merging chunks."""
+
+    chunks: list[object] = []
+    for chunk in llm.stream(messages):
+        text = _extract_response_text(chunk)
+        if text:
+            on_delta(text)
+        chunks.append(chunk)
+    if not chunks:
+        return ""
+    # Merge once at the end; adding a list of message chunks joins their content
+    # in one pass instead of recopying it per delta, and keeps refusal metadata.
+    return chunks[0] + chunks[1:] if len(chunks) > 1 else chunks[0]
+
+
 def _sanitize_freeform_output(raw_text: str) -> tuple[bool, str]:
     """Sanitize free-form output before display."""
 
@@ -293,7 +313,7 @@ def generate_langchain_questions(
     llm_start = time.monotonic()
     ok, raw_text = generate_langchain_completion(
         payload,
-        response_format={"type": "json_schema", "json_schema": STRUCTURED_OUTPUT_SCHEMA},
+        response_format=get_response_format(),
     )
     llm_duration_ms = int((time.monotonic() - llm_start) * 1000)
     _LOGGER.info(
@@ -320,8 +340,15 @@ def generate_langchain_questions(
     return True, parsed
 
 
-def generate_langchain_chat_response(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a free-form chat response via LangChain."""
+def generate_langchain_chat_response(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a free-form chat response via LangChain.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams;
+    the returned text is the sanitized final response.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("langchain_chat_request_received", extra=request_meta)
@@ -378,8 +405,12 @@ def generate_langchain_chat_response(payload: RequestPayload) -> tuple[bool, str
     )
     llm = ChatOpenAI(**llm_kwargs)
 
-    # Invoke the model and sanitize the free-form response.
-    response = llm.invoke(_build_langchain_messages(messages))
+    # Invoke (or stream) the model and sanitize the free-form response.
+    langchain_messages = _build_langchain_messages(messages)
+    if on_delta is None:
+        response = llm.invoke(langchain_messages)
+    else:
+        response = _stream_response(llm, langchain_messages, on_delta)
     refusal = _extract_refusal(response)
     if refusal:
         _LOGGER.info("langchain_chat_refusal")
@@ -391,8 +422,14 @@ def generate_langchain_chat_response(payload: RequestPayload) -> tuple[bool, str
     return True, sanitized
 
 
-def generate_langchain_cover_letter_response(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a German cover letter via LangChain."""
+def generate_langchain_cover_letter_response(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a German cover letter via LangChain.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("langchain_cover_letter_request_received", extra=request_meta)
@@ -457,8 +494,12 @@ def generate_langchain_cover_letter_response(payload: RequestPayload) -> tuple[b
     )
     llm = ChatOpenAI(**llm_kwargs)
 
-    # Invoke the model and sanitize the free-form response.
-    response = llm.invoke(_build_langchain_messages(messages))
+    # Invoke (or stream) the model and sanitize the free-form response.
+    langchain_messages = _build_langchain_messages(messages)
+    if on_delta is None:
+        response = llm.invoke(langchain_messages)
+    else:
+        response = _stream_response(llm, langchain_messages, on_delta)
     refusal = _extract_refusal(response)
     if refusal:
         _LOGGER.info("langchain_cover_letter_refusal")
@@ -470,8 +511,14 @@ def generate_langchain_cover_letter_response(payload: RequestPayload) -> tuple[b
     return True, sanitized
 
 
-def generate_langchain_chat_summary(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a concise summary of the current chat transcript via LangChain."""
+def generate_langchain_chat_summary(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a concise summary of the current chat transcript via LangChain.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("langchain_chat_summary_request_received", extra=request_meta)
@@ -528,8 +575,12 @@ def generate_langchain_chat_summary(payload: RequestPayload) -> tuple[bool, str]
     )
     llm = ChatOpenAI(**llm_kwargs)
 
-    # Invoke the model and sanitize the free-form response.
-    response = llm.invoke(_build_langchain_messages(messages))
+    # Invoke (or stream) the model and sanitize the free-form response.
+    langchain_messages = _build_langchain_messages(messages)
+    if on_delta is None:
+        response = llm.invoke(langchain_messages)
+    else:
+        response = _stream_response(llm, langchain_messages, on_delta)
     refusal = _extract_refusal(response)
     if refusal:
         _LOGGER.info("langchain_chat_summary_refusal")
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from app.core.model_catalog import DEFAULT_MODEL, get_reasoning_effort_options, is_gpt5_model
-from app.core.structured_output import STRUCTURED_OUTPUT_SCHEMA
+from app.core.model_catalog import (
+    DEFAULT_MODEL,
+    get_model_class,
+    get_reasoning_effort_options,
+    is_gpt5_model,
+)
+from app.core.structured_output import get_response_format
 
 _DOTENV_LOADED = False
 
@@ -35,12 +42,22 @@ def _load_dotenv_once() -> None:
     _LOGGER.info("dotenv_loaded")
 
 
+@functools.cache
+def get_openai_client() -> Any:
+    """Return the process-wide OpenAI client so all callers share one connection pool."""
+
+    # Load .env first so the client picks up local credentials on first use.
+    _load_dotenv_once()
+    return OpenAI()
+
+
 def _request_completion(
     messages: list[dict[str, str]],
     temperature: float | None,
     model_name: str | None = None,
     response_format: dict[str, object] | None = None,
     reasoning_effort: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> tuple[bool, str]:
     """Send a chat completion request with optional response formatting."""
 
@@ -69,7 +86,7 @@ def _request_completion(
             "response_format": "json_schema" if response_format else "text",
         },
     )
-    client = OpenAI()
+    client = get_openai_client()
     request_payload: dict[str, Any] = {
         "model": selected_model,
         "messages": messages,
@@ -78,12 +95,14 @@ def _request_completion(
         request_payload["temperature"] = temperature
     if response_format:
         request_payload["response_format"] = response_format
-    if reasoning_effort and is_gpt5_model(selected_model) and selected_model != "gpt-5.2-chat-latest":
+    if reasoning_effort and get_model_class(selected_model) == "gpt5_reasoning":
         allowed_efforts = get_reasoning_effort_options(selected_model)
         if reasoning_effort not in allowed_efforts and allowed_efforts:
             reasoning_effort = allowed_efforts[0]
         if reasoning_effort:
             request_payload["reasoning_effort"] = reasoning_effort
+    if on_delta is not None:
+        return _stream_completion(client, request_payload, on_delta)
     response = client.chat.completions.create(**request_payload)
     # Extract the first response choice for a single-turn UI.
     message = response.choices[0].message
@@ -95,6 +114,32 @@ def _request_completion(
     return True, message.content or ""
 
 
+def _stream_completion(
+    client: Any,
+    request_payload: dict[str, Any],
+    on_delta: Callable[[str], None],
+) -> tuple[bool, str]:
+    """Stream a completion, forwarding content deltas as they arrive."""
+
+    content_parts: list[str] = []
+    refusal_parts: list[str] = []
+    for chunk in client.chat.completions.create(**request_payload, stream=True):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta
+        refusal = getattr(delta, "refusal", None)
+        if refusal:
+            refusal_parts.append(refusal)
+        if delta.content:
+            content_parts.append(delta.content)
+            on_delta(delta.content)
+    if refusal_parts:
+        # Surface refusal text without exposing additional content.
+        _LOGGER.info("openai_refusal")
+        return False, "".join(refusal_parts)
+    return True, "".join(content_parts)
+
+
 def generate_completion(
     messages: list[dict[str, str]],
     temperature: float | None,
@@ -107,7 +152,7 @@ def generate_completion(
         messages,
         temperature,
         model_name=model_name,
-        response_format={"type": "json_schema", "json_schema": STRUCTURED_OUTPUT_SCHEMA},
+        response_format=get_response_format(),
         reasoning_effort=reasoning_effort,
     )
 
@@ -117,12 +162,18 @@ def generate_chat_completion(
     temperature: float | None,
     model_name: str | None = None,
     reasoning_effort: str | None = None,
+    on_delta: Callable[[str], None] | None = None,
 ) -> tuple[bool, str]:
-    """Generate a free-form chat completion using the configured OpenAI model."""
+    """Generate a free-form chat completion using the configured OpenAI model.
+
+    When ``on_delta`` is provided the response is streamed and each text delta
+    is forwarded to it before the full text is returned.
+    """
 
     return _request_completion(
         messages,
         temperature,
         model_name=model_name,
         reasoning_effort=reasoning_effort,
+        on_delta=on_delta,
     )
@@ -7,6 +7,8 @@ import os
 
 _DEFAULT_LOG_LEVEL = "INFO"
 _LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+# Level applied by the last setup call so Streamlit reruns can skip reconfiguration.
+_CONFIGURED_LEVEL: int | None = None
 
 
 def _resolve_log_level(level_name: str | None) -> int:
@@ -22,9 +24,14 @@ def _resolve_log_level(level_name: str | None) -> int:
 def setup_logging(level_name: str | None = None) -> None:
     """Configure standard console logging for the app."""
 
+    global _CONFIGURED_LEVEL
     # Resolve the desired level from explicit input or LOG_LEVEL env var.
     resolved_level = _resolve_log_level(level_name or os.getenv("LOG_LEVEL"))
     root_logger = logging.getLogger()
+    # Streamlit reruns call this on every interaction; skip when nothing changed.
+    if _CONFIGURED_LEVEL == resolved_level and root_logger.handlers:
+        return
+    _CONFIGURED_LEVEL = resolved_level
     if root_logger.handlers:
         # Reuse existing handlers but ensure they emit at the desired level.
         root_logger.setLevel(resolved_level)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import functools
+from typing import Literal
+
+ModelClass = Literal["chat_default", "gpt5_reasoning", "standard"]
+
 # Centralize model choices so UI and client stay consistent.
 ALLOWED_MODELS: list[str] = [
     "gpt-4o-mini",
@@ -12,6 +17,8 @@ ALLOWED_MODELS: list[str] = [
 # Default to GPT-5.2 chat for the landing-page experience.
 DEFAULT_MODEL = "gpt-5.2-chat-latest"
 GPT5_MODELS = {"gpt-5-nano", "gpt-5.2-chat-latest"}
+# GPT-5 models that accept neither temperature nor reasoning effort.
+_CHAT_DEFAULT_MODELS = {"gpt-5.2-chat-latest"}
 _REASONING_EFFORT_BY_MODEL = {
     "gpt-5-nano": ["minimal", "low", "medium", "high"],
 }
@@ -31,6 +38,17 @@ def is_gpt5_model(model_name: str) -> bool:
     return model_name in GPT5_MODELS
 
 
+@functools.cache
+def get_model_class(model_name: str) -> ModelClass:
+    """Return which tuning controls the model supports."""
+
+    if model_name in _CHAT_DEFAULT_MODELS:
+        return "chat_default"
+    if model_name in GPT5_MODELS:
+        return "gpt5_reasoning"
+    return "standard"
+
+
 def get_reasoning_effort_options(model_name: str) -> list[str]:
     """Return the allowed reasoning effort values for the given model."""
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import time
+from collections.abc import Callable
 
 from app.core.dataclasses import RequestPayload
 from app.core.llm.openai_client import generate_chat_completion, generate_completion
@@ -21,19 +22,14 @@ from app.core.safety import (
     validate_inputs,
     validate_output,
 )
-from app.core.structured_output import validate_structured_response
+from app.core.structured_output import (
+    REQUIRED_RESPONSE_KEYS,
+    loads,
+    validate_structured_response,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-_REQUIRED_RESPONSE_KEYS = {
-    "target_role_context",
-    "cv_note",
-    "alignments",
-    "gaps_or_risk_areas",
-    "interview_questions",
-    "next_step_suggestions",
-}
-
 
 def _select_variant(payload: RequestPayload):
     # Match the requested variant id, falling back to the first for safety.
@@ -123,7 +119,7 @@ def _parse_structured_output(raw_text: str) -> tuple[bool, dict[str, object] | s
 
     # Parse the JSON response while avoiding raw-content logging.
     try:
-        parsed = json.loads(raw_text)
+        parsed = loads(raw_text)
     except json.JSONDecodeError:
         _LOGGER.error("structured_output_parse_failed", extra={"reason": "json_decode"})
         return False, "The model returned invalid JSON. Please try again."
@@ -132,16 +128,16 @@ def _parse_structured_output(raw_text: str) -> tuple[bool, dict[str, object] | s
         _LOGGER.error("structured_output_parse_failed", extra={"reason": "not_object"})
         return False, "The model returned an unexpected JSON shape. Please try again."
 
-    missing = _REQUIRED_RESPONSE_KEYS.difference(parsed.keys())
-    if missing:
-        _LOGGER.error(
-            "structured_output_parse_failed",
-            extra={"reason": "missing_keys", "missing_count": len(missing)},
-        )
-        return False, "The model response was missing required fields. Please try again."
-
+    # Validate first so the happy path walks the response only once.
     ok, message = validate_structured_response(parsed)
     if not ok:
+        missing = REQUIRED_RESPONSE_KEYS.difference(parsed.keys())
+        if missing:
+            _LOGGER.error(
+                "structured_output_parse_failed",
+                extra={"reason": "missing_keys", "missing_count": len(missing)},
+            )
+            return False, "The model response was missing required fields. Please try again."
         _LOGGER.error(
             "structured_output_parse_failed",
             extra={"reason": "contract_validation_failed"},
@@ -216,8 +212,15 @@ def generate_questions(payload: RequestPayload) -> tuple[bool, dict[str, object]
     return True, parsed
 
 
-def generate_chat_response(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a free-form chat response or return a refusal message."""
+def generate_chat_response(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a free-form chat response or return a refusal message.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams;
+    the returned text is the sanitized final response.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("chat_request_received", extra=request_meta)
@@ -253,6 +256,7 @@ def generate_chat_response(payload: RequestPayload) -> tuple[bool, str]:
         payload.temperature,
         model_name=payload.model_name,
         reasoning_effort=payload.reasoning_effort,
+        on_delta=on_delta,
     )
     llm_duration_ms = int((time.monotonic() - llm_start) * 1000)
     _LOGGER.info(
@@ -272,8 +276,14 @@ def generate_chat_response(payload: RequestPayload) -> tuple[bool, str]:
     return True, sanitized
 
 
-def generate_cover_letter_response(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a German cover letter or return a refusal message."""
+def generate_cover_letter_response(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a German cover letter or return a refusal message.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("cover_letter_request_received", extra=request_meta)
@@ -318,6 +328,7 @@ def generate_cover_letter_response(payload: RequestPayload) -> tuple[bool, str]:
         payload.temperature,
         model_name=payload.model_name,
         reasoning_effort=payload.reasoning_effort,
+        on_delta=on_delta,
     )
     llm_duration_ms = int((time.monotonic() - llm_start) * 1000)
     _LOGGER.info(
@@ -337,8 +348,14 @@ def generate_cover_letter_response(payload: RequestPayload) -> tuple[bool, str]:
     return True, sanitized
 
 
-def generate_chat_summary_response(payload: RequestPayload) -> tuple[bool, str]:
-    """Generate a concise summary of the current chat transcript."""
+def generate_chat_summary_response(
+    payload: RequestPayload,
+    on_delta: Callable[[str], None] | None = None,
+) -> tuple[bool, str]:
+    """Generate a concise summary of the current chat transcript.
+
+    Raw text deltas are forwarded to ``on_delta`` while the response streams.
+    """
 
     request_meta = _payload_metadata(payload)
     _LOGGER.info("chat_summary_request_received", extra=request_meta)
@@ -375,6 +392,7 @@ def generate_chat_summary_response(payload: RequestPayload) -> tuple[bool, str]:
         payload.temperature,
         model_name=payload.model_name,
         reasoning_effort=payload.reasoning_effort,
+        on_delta=on_delta,
     )
     llm_duration_ms = int((time.monotonic() - llm_start) * 1000)
     _LOGGER.info(
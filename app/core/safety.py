@@ -5,14 +5,11 @@ from __future__ import annotations
 import re
 import secrets
 import logging
+import threading
 import time
 from typing import Iterable
 
-# Optional import so tests can run without the dependency installed.
-try:
-    from openai import OpenAI
-except ImportError:  # pragma: no cover - exercised when dependency is missing
-    OpenAI = None
+from app.core.llm.openai_client import OpenAI, get_openai_client
 
 # Length limits keep payloads bounded for safety and cost.
 MAX_JOB_DESCRIPTION_LENGTH = 6000
@@ -84,15 +81,24 @@ _ILLEGAL_TARGET_PATTERNS: Iterable[re.Pattern[str]] = (
     re.compile(r"\bidentity theft\b"),
 )
 _CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]")
+_SALTED_TAG_PATTERN = re.compile(r"</?user-(job|cv|prompt)-[a-f0-9]+>", re.IGNORECASE)
+_SYSTEM_PROMPT_PATTERN = re.compile(r"\bsystem prompt\b", re.IGNORECASE)
 _OUTPUT_FORBIDDEN_PATTERNS: Iterable[re.Pattern[str]] = (
-    re.compile(r"</?user-(job|cv|prompt)-[a-f0-9]+>", re.IGNORECASE),
-    re.compile(r"\bsystem prompt\b", re.IGNORECASE),
+    _SALTED_TAG_PATTERN,
+    _SYSTEM_PROMPT_PATTERN,
 )
+# A trailing "<tag" fragment may still grow into a salted tag while streaming.
+_TRAILING_PARTIAL_TAG_PATTERN = re.compile(r"</?[\w-]*$")
 _SAFETY_EVENT_COUNTS: dict[str, int] = {}
 _SAFETY_LOGGER = logging.getLogger(__name__)
-_RATE_LIMIT_BUCKETS: dict[str, list[float]] = {}
+# Token buckets per key as (tokens, last refill timestamp); sessions share the lock.
+_RATE_LIMIT_BUCKETS: dict[str, tuple[float, float]] = {}
+_RATE_LIMIT_LOCK = threading.Lock()
 _RATE_LIMIT_WINDOW_SECONDS = 30
 _RATE_LIMIT_MAX_REQUESTS = 5
+_RATE_LIMIT_REFILL_PER_SECOND = _RATE_LIMIT_MAX_REQUESTS / _RATE_LIMIT_WINDOW_SECONDS
+# Buckets idle for a full window are back at capacity, so sweeping them is lossless.
+_RATE_LIMIT_LAST_SWEEP = 0.0
 _MODERATION_MODEL = "omni-moderation-latest"
 
 
@@ -123,7 +129,7 @@ def _moderation_flagged(text: str) -> bool | None:
     if not text.strip():
         return None
     try:
-        client = OpenAI()
+        client = get_openai_client()
         response = client.moderations.create(model=_MODERATION_MODEL, input=text)
     except Exception:
         # Fail open so validation still works if the moderation API is unavailable.
@@ -187,16 +193,32 @@ def record_safety_event(event_type: str, details: dict | None = None) -> None:
 def check_rate_limit(key: str, now: float | None = None) -> tuple[bool, str | None]:
     """Check whether the key has exceeded the configured request rate."""
 
+    global _RATE_LIMIT_LAST_SWEEP
     # Use the current wall time unless tests pass a fixed value.
     timestamp = time.time() if now is None else now
-    window_start = timestamp - _RATE_LIMIT_WINDOW_SECONDS
-    bucket = _RATE_LIMIT_BUCKETS.setdefault(key or "anonymous", [])
-    # Trim old entries to keep memory bounded.
-    bucket[:] = [entry for entry in bucket if entry >= window_start]
-    if len(bucket) >= _RATE_LIMIT_MAX_REQUESTS:
+    bucket_key = key or "anonymous"
+    with _RATE_LIMIT_LOCK:
+        # Drop buckets of abandoned sessions at most once per window.
+        if timestamp - _RATE_LIMIT_LAST_SWEEP >= _RATE_LIMIT_WINDOW_SECONDS:
+            _RATE_LIMIT_LAST_SWEEP = timestamp
+            idle_before = timestamp - _RATE_LIMIT_WINDOW_SECONDS
+            for idle_key in [
+                bucket for bucket, (_, last) in _RATE_LIMIT_BUCKETS.items() if last <= idle_before
+            ]:
+                del _RATE_LIMIT_BUCKETS[idle_key]
+        tokens, last = _RATE_LIMIT_BUCKETS.get(
+            bucket_key, (float(_RATE_LIMIT_MAX_REQUESTS), timestamp)
+        )
+        # Refill at a steady rate so bursts cannot double up at window boundaries.
+        tokens = min(
+            tokens + max(timestamp - last, 0.0) * _RATE_LIMIT_REFILL_PER_SECOND,
+            float(_RATE_LIMIT_MAX_REQUESTS),
+        )
+        allowed = tokens >= 1.0
+        _RATE_LIMIT_BUCKETS[bucket_key] = (tokens - 1.0 if allowed else tokens, timestamp)
+    if not allowed:
         record_safety_event("rate_limited", {"key": key})
         return False, "Too many requests. Please wait a moment and try again."
-    bucket.append(timestamp)
     return True, None
 
 
@@ -215,18 +237,24 @@ def validate_output(raw_text: str) -> tuple[bool, str | None]:
 def sanitize_output(raw_text: str) -> str:
     """Remove internal tags or system prompt references from model output."""
 
-    sanitized = raw_text
     # Strip salted tags while preserving surrounding content.
-    sanitized = re.sub(
-        r"</?user-(job|cv|prompt)-[a-f0-9]+>", "", sanitized, flags=re.IGNORECASE
-    )
+    sanitized = _SALTED_TAG_PATTERN.sub("", raw_text)
     # Redact explicit mentions of the system prompt.
-    sanitized = re.sub(r"(?i)\bsystem prompt\b", "[redacted]", sanitized)
+    sanitized = _SYSTEM_PROMPT_PATTERN.sub("[redacted]", sanitized)
     if sanitized != raw_text:
         record_safety_event("output_sanitized")
     return sanitized
 
 
+def redact_partial_output(partial_text: str) -> str:
+    """Redact in-progress streamed output for display without recording events."""
+
+    # Hold back a trailing fragment until it is known not to be a salted tag.
+    redacted = _TRAILING_PARTIAL_TAG_PATTERN.sub("", partial_text)
+    redacted = _SALTED_TAG_PATTERN.sub("", redacted)
+    return _SYSTEM_PROMPT_PATTERN.sub("[redacted]", redacted)
+
+
 def generate_salt(num_bytes: int = 6) -> str:
     """Return a random hex salt for per-request tag names."""
 
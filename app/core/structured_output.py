@@ -2,10 +2,49 @@
 
 from __future__ import annotations
 
-import re
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
+
+# Prefer orjson for faster (de)serialization; fall back to stdlib json when missing.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when dependency is missing
+    orjson = None
+
+# Single source of truth for the response fields shared by schema and validators.
+_REQUIRED_FIELDS = (
+    "target_role_context",
+    "cv_note",
+    "alignments",
+    "gaps_or_risk_areas",
+    "interview_questions",
+    "next_step_suggestions",
+)
+
+
+def _freeze(value: object) -> object:
+    # Recursively swap dicts for read-only proxies and lists for tuples.
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: object) -> object:
+    # Rebuild plain dicts and lists from a frozen structure.
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 
 # Schema used by the OpenAI client to enforce structured JSON output.
-STRUCTURED_OUTPUT_SCHEMA: dict[str, object] = {
+# Frozen all the way down so shared call sites cannot mutate the singleton.
+STRUCTURED_OUTPUT_SCHEMA: Mapping[str, object] = _freeze({
     "name": "interview_practice_response",
     "strict": True,
     "schema": {
@@ -35,7 +74,7 @@ STRUCTURED_OUTPUT_SCHEMA: dict[str, object] = {
             },
             "interview_questions": {
                 "type": "array",
-                "description": "Exactly 5 tagged questions, each starting with a tag like [Technical].",
+                "description": "Exactly 5 tagged questions, each starting with an allowed tag such as [Technical].",
                 "items": {"type": "string"},
                 "minItems": 5,
                 "maxItems": 5,
@@ -48,20 +87,25 @@ STRUCTURED_OUTPUT_SCHEMA: dict[str, object] = {
                 "maxItems": 4,
             },
         },
-        "required": [
-            "target_role_context",
-            "cv_note",
-            "alignments",
-            "gaps_or_risk_areas",
-            "interview_questions",
-            "next_step_suggestions",
-        ],
+        "required": list(_REQUIRED_FIELDS),
         "additionalProperties": False,
     },
-}
+})
+
+
+def get_schema_dict() -> dict[str, object]:
+    """Return a fresh plain-dict copy of the schema that SDKs can serialize."""
+
+    return _thaw(STRUCTURED_OUTPUT_SCHEMA)
+
+
+def get_response_format() -> dict[str, object]:
+    """Return a fresh request-level response_format for the OpenAI and LangChain clients."""
+
+    return {"type": "json_schema", "json_schema": get_schema_dict()}
 
 # Prompt guidance that mirrors the schema so the model knows the exact structure.
-STRUCTURED_OUTPUT_GUIDANCE = (
+STRUCTURED_OUTPUT_GUIDANCE: Final[str] = (
     "Return JSON only that matches this exact shape:\n"
     "{\n"
     '  "target_role_context": ["..."],\n'
@@ -76,7 +120,7 @@ STRUCTURED_OUTPUT_GUIDANCE = (
     "- cv_note: a single sentence only when CV is missing; otherwise null.\n"
     "- alignments: only when JD + CV are provided; otherwise return an empty list.\n"
     "- gaps_or_risk_areas: if CV missing, ask the user to self-identify gaps.\n"
-    "- interview_questions: exactly 5 strings, each prefixed with a tag like "
+    "- interview_questions: exactly 5 strings, each prefixed with exactly one of these tags: "
     "[Technical], [Behavioral], [Role-specific], [Screening], [Onsite], [Final], or [General].\n"
     "- next_step_suggestions: 2-4 short follow-up ideas.\n"
     "- Write all strings in English and use Markdown-friendly text inside each string "
@@ -84,25 +128,94 @@ STRUCTURED_OUTPUT_GUIDANCE = (
     "Do not include markdown, prose outside JSON, or extra keys."
 )
 
-_REQUIRED_KEYS = {
-    "target_role_context",
-    "cv_note",
-    "alignments",
-    "gaps_or_risk_areas",
-    "interview_questions",
-    "next_step_suggestions",
-}
-_TAGGED_QUESTION_PATTERN = re.compile(r"^\[[^\]]+\]\s*\S")
+REQUIRED_RESPONSE_KEYS = frozenset(_REQUIRED_FIELDS)
+
+# Markdown headings and prefixes reused on every render.
+_TITLE_ROLE_CONTEXT = "## Target Role Context"
+_TITLE_CV_NOTE = "## CV Note"
+_TITLE_ALIGNMENTS = "## Alignments"
+_TITLE_GAPS = "## Gaps / Risk areas"
+_TITLE_QUESTIONS = "## Interview Questions"
+_TITLE_NEXT_STEPS = "## Next-step suggestions"
+_BULLET_PREFIX = "- "
+# Allowed question tags; str.startswith with a tuple avoids a regex match per question.
+_ALLOWED_QUESTION_TAGS: tuple[str, ...] = (
+    "[Technical]",
+    "[Behavioral]",
+    "[Role-specific]",
+    "[Screening]",
+    "[Onsite]",
+    "[Final]",
+    "[General]",
+)
+# (field, min_items, max_items) bounds shared by the fast and diagnostic validators.
+_LIST_FIELD_BOUNDS: tuple[tuple[str, int, int | None], ...] = (
+    ("target_role_context", 1, 3),
+    ("alignments", 0, 5),
+    ("gaps_or_risk_areas", 1, None),
+    ("interview_questions", 5, 5),
+    ("next_step_suggestions", 2, 4),
+)
+
+
+def loads(raw_text: str) -> object:
+    """Decode JSON text, raising json.JSONDecodeError on invalid input."""
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(raw_text)
+    return json.loads(raw_text)
+
+
+def dumps(value: object) -> str:
+    """Encode a value as compact JSON text."""
+
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _is_tagged_question(text: str) -> bool:
+    """Return True when text starts with an allowed tag followed by question text."""
+
+    stripped = text.strip()
+    # Tags never contain "]", so the first one closes the tag.
+    return stripped.startswith(_ALLOWED_QUESTION_TAGS) and bool(
+        stripped.partition("]")[2].strip()
+    )
+
+
+def _is_valid_fast(response: dict[str, object]) -> bool:
+    """Return True when the response satisfies the contract, without diagnostics."""
+
+    if response.keys() != REQUIRED_RESPONSE_KEYS:
+        return False
+    cv_note = response["cv_note"]
+    if cv_note is not None and not (isinstance(cv_note, str) and cv_note.strip()):
+        return False
+    for name, min_items, max_items in _LIST_FIELD_BOUNDS:
+        value = response[name]
+        if not isinstance(value, list) or len(value) < min_items:
+            return False
+        if max_items is not None and len(value) > max_items:
+            return False
+        if not all(isinstance(item, str) and item.strip() for item in value):
+            return False
+    return all(_is_tagged_question(item) for item in response["interview_questions"])
 
 
 def validate_structured_response(response: dict[str, object]) -> tuple[bool, str | None]:
     """Validate the structured response against the contract expectations."""
 
-    missing = _REQUIRED_KEYS.difference(response.keys())
+    # Valid responses are the common case under strict schemas; only diagnose failures.
+    if _is_valid_fast(response):
+        return True, None
+
+    missing = REQUIRED_RESPONSE_KEYS.difference(response.keys())
     if missing:
         return False, "The model response was missing required fields. Please try again."
 
-    extra = set(response.keys()).difference(_REQUIRED_KEYS)
+    extra = set(response.keys()).difference(REQUIRED_RESPONSE_KEYS)
     if extra:
         return False, "The model response included unexpected fields. Please try again."
 
@@ -122,105 +235,70 @@ def validate_structured_response(response: dict[str, object]) -> tuple[bool, str
         for item in value:
             if not isinstance(item, str) or not item.strip():
                 return False, f"The model response field '{name}' must contain strings."
-            if require_tagged_questions and not _TAGGED_QUESTION_PATTERN.match(item.strip()):
+            if require_tagged_questions and not _is_tagged_question(item):
                 return False, "Each interview question must start with a tag like [Technical]."
         return True, None
 
-    ok, message = _validate_list("target_role_context", response.get("target_role_context"), 1, 3)
-    if not ok:
-        return False, message
-
-    cv_note = response.get("cv_note")
+    cv_note = response["cv_note"]
     if cv_note is not None:
         if not isinstance(cv_note, str) or not cv_note.strip():
             return False, "The model response field 'cv_note' must be a string or null."
 
-    ok, message = _validate_list("alignments", response.get("alignments"), 0, 5)
-    if not ok:
-        return False, message
+    for name, min_items, max_items in _LIST_FIELD_BOUNDS:
+        ok, message = _validate_list(
+            name,
+            response[name],
+            min_items,
+            max_items,
+            require_tagged_questions=name == "interview_questions",
+        )
+        if not ok:
+            return False, message
 
-    ok, message = _validate_list("gaps_or_risk_areas", response.get("gaps_or_risk_areas"), 1, None)
-    if not ok:
-        return False, message
+    return True, None
 
-    ok, message = _validate_list(
-        "interview_questions",
-        response.get("interview_questions"),
-        5,
-        5,
-        require_tagged_questions=True,
-    )
-    if not ok:
-        return False, message
 
-    ok, message = _validate_list("next_step_suggestions", response.get("next_step_suggestions"), 2, 4)
-    if not ok:
-        return False, message
+def _as_list(value: object) -> list[str]:
+    # Coerce list fields to strings and treat anything else as empty.
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return []
 
-    return True, None
+
+def _add_bullets(lines: list[str], title: str, items: list[str]) -> None:
+    # Append a titled bullet section followed by a blank separator line.
+    if not items:
+        return
+    lines.append(title)
+    lines.extend(_BULLET_PREFIX + item for item in items)
+    lines.append("")
+
+
+def _add_numbered(lines: list[str], title: str, items: list[str]) -> None:
+    # Append a titled numbered section followed by a blank separator line.
+    if not items:
+        return
+    lines.append(title)
+    lines.extend(f"{index}. {item}" for index, item in enumerate(items, 1))
+    lines.append("")
 
 
 def render_markdown_from_response(response: dict[str, object]) -> str:
     """Convert the structured response dict into user-friendly markdown."""
 
-    def _as_list(value: object) -> list[str]:
-        if isinstance(value, list):
-            return [str(item) for item in value]
-        return []
-
-    def _add_section(lines: list[str], title: str, items: list[str], numbered: bool) -> None:
-        if not items:
-            return
-        lines.append(f"## {title}")
-        if numbered:
-            for index, item in enumerate(items, 1):
-                lines.append(f"{index}. {item}")
-        else:
-            for item in items:
-                lines.append(f"- {item}")
-        lines.append("")
-
     sections: list[str] = []
 
-    _add_section(
-        sections,
-        "Target Role Context",
-        _as_list(response.get("target_role_context")),
-        numbered=False,
-    )
+    _add_bullets(sections, _TITLE_ROLE_CONTEXT, _as_list(response.get("target_role_context")))
 
     cv_note = response.get("cv_note")
     if isinstance(cv_note, str) and cv_note.strip():
-        sections.append("## CV Note")
+        sections.append(_TITLE_CV_NOTE)
         sections.append(cv_note.strip())
         sections.append("")
 
-    _add_section(
-        sections,
-        "Alignments",
-        _as_list(response.get("alignments")),
-        numbered=False,
-    )
-
-    _add_section(
-        sections,
-        "Gaps / Risk areas",
-        _as_list(response.get("gaps_or_risk_areas")),
-        numbered=False,
-    )
-
-    _add_section(
-        sections,
-        "Interview Questions",
-        _as_list(response.get("interview_questions")),
-        numbered=True,
-    )
-
-    _add_section(
-        sections,
-        "Next-step suggestions",
-        _as_list(response.get("next_step_suggestions")),
-        numbered=False,
-    )
+    _add_bullets(sections, _TITLE_ALIGNMENTS, _as_list(response.get("alignments")))
+    _add_bullets(sections, _TITLE_GAPS, _as_list(response.get("gaps_or_risk_areas")))
+    _add_numbered(sections, _TITLE_QUESTIONS, _as_list(response.get("interview_questions")))
+    _add_bullets(sections, _TITLE_NEXT_STEPS, _as_list(response.get("next_step_suggestions")))
 
     return "\n".join(sections).strip()
@@ -29,6 +29,9 @@ _IMPLEMENTATION_LABELS = {
 }
 
 _BASE_DIR = Path(__file__).resolve().parent
+# Resolve page paths once at import instead of on every rerun.
+_LANGCHAIN_CHAT_PAGE = _BASE_DIR / "pages" / "2_LangChain_Chat.py"
+_LANGCHAIN_QUESTIONS_PAGE = _BASE_DIR / "pages" / "3_LangChain_Questions_Generator.py"
 
 
 def _normalize_mode(value: str | None) -> str:
@@ -67,18 +70,19 @@ def main() -> None:
 
     impl_mode = _resolve_impl_mode()
 
-    # Build the navigation list for the LangChain-only experience.
+    # Build the navigation list for the LangChain-only experience. st.Page
+    # objects carry per-run navigation state, so they are created on every run.
     pages: list[st.Page] = []
     if impl_mode == "langchain":
         pages.extend(
             [
                 st.Page(
-                    str(_BASE_DIR / "pages" / "2_LangChain_Chat.py"),
+                    str(_LANGCHAIN_CHAT_PAGE),
                     title="Interview Preparation Chat",
                     default=True,
                 ),
                 st.Page(
-                    str(_BASE_DIR / "pages" / "3_LangChain_Questions_Generator.py"),
+                    str(_LANGCHAIN_QUESTIONS_PAGE),
                     title="Interview Questions Generator",
                 ),
             ]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
+import itertools
 import logging
-import uuid
-from collections.abc import Callable
+import re
+import secrets
+import time
+from collections.abc import Callable, Sequence
 from datetime import date
 from typing import Any
 
@@ -20,31 +23,117 @@ from app.core.chat_exports import (
 from app.core.chat_history import (
     ChatMessage,
     append_chat_message,
+    compute_trim_start,
     init_chat_history,
-    trim_chat_history,
 )
-from app.core.dataclasses import RequestPayload
+from app.core.dataclasses import PromptVariant, RequestPayload
 from app.core.model_catalog import (
     DEFAULT_MODEL,
     DEFAULT_REASONING_EFFORT,
     get_allowed_models,
+    get_model_class,
     get_reasoning_effort_options,
-    is_gpt5_model,
 )
 from app.core.prompts import (
     DEFAULT_CHAT_PROMPT_VARIANT_ID,
     get_chat_prompt_variant_description,
     get_chat_prompt_variant_display_name,
 )
-from app.core.safety import check_rate_limit
+from app.core.safety import check_rate_limit, redact_partial_output
+from app.core.structured_output import dumps as dumps_json
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resolve the model catalog and its default selectbox index once at import.
+_ALLOWED_MODELS = tuple(get_allowed_models())
+_DEFAULT_MODEL_INDEX = (
+    _ALLOWED_MODELS.index(DEFAULT_MODEL) if DEFAULT_MODEL in _ALLOWED_MODELS else 0
+)
+
 # Keep a conservative character limit so chat history stays manageable.
 _MAX_HISTORY_CHARS = 4000
+# Once the window overflows, cut down to this so the oldest kept turn stays put for a while.
+_HISTORY_LOW_WATER_CHARS = 2800
 # Summary should include as much of the transcript as possible.
 _MAX_SUMMARY_HISTORY_CHARS = 28000
 
+# Spinner text, log event prefix, and history budget per kind of generated reply.
+_GENERATION_SPECS = {
+    "chat": ("Drafting response...", "chat_request", _MAX_HISTORY_CHARS),
+    "summary": ("Summarizing chat...", "chat_summary_request", _MAX_SUMMARY_HISTORY_CHARS),
+    "cover_letter": ("Drafting cover letter...", "cover_letter_request", _MAX_HISTORY_CHARS),
+}
+
+# Minimum delay between placeholder updates while a response streams.
+_STREAM_FLUSH_INTERVAL_SECONDS = 0.03
+
+# Transcript prefixes per role; any non-user role is serialized as the assistant.
+_TRANSCRIPT_ROLE_PREFIXES = {"user": "User: ", "assistant": "Assistant: "}
+
+# Only the most recent assistant turns show their action row inline.
+_FULL_ACTION_TURNS = 3
+
+# Only this many of the newest turns render until earlier history is requested.
+_HISTORY_RENDER_WINDOW = 40
+
+# Identical chat submissions closer together than this are treated as duplicates.
+_SUBMIT_DEBOUNCE_SECONDS = 0.2
+
+# Responses longer than this start collapsed instead of rendering inline.
+_COLLAPSE_RESPONSE_CHARS = 20000
+
+# Any of these means the text needs the markdown renderer (formatting, links, emoji, LaTeX).
+_MARKDOWN_SYNTAX_PATTERN = re.compile(
+    r"[*_`#>|~\[\]<&$\\]"
+    r"|:[\w+-]+:"
+    r"|https?://|www\."
+    r"|^\s*(?:[-+=]|\d+[.)])(?:\s|$)"
+    r"|\n",
+    re.MULTILINE,
+)
+
+# Static HTML/CSS/JS blobs injected by the chat UI.
+_CHAT_ACTION_BUTTON_STYLES = """
+<style>
+div[data-testid="stChatMessage"] div[data-testid="stButton"] > button,
+div[data-testid="stChatMessage"] div[data-testid="stDownloadButton"] > button {
+  font-size: 0.84rem;
+  padding: 0.20rem 0.55rem;
+  min-height: 1.95rem;
+}
+</style>
+"""
+_SCROLL_TO_LATEST_SCRIPT = """
+<script>
+const doc = window.parent.document;
+const chatMessages = doc.querySelectorAll('[data-testid="stChatMessage"]');
+if (chatMessages.length > 0) {
+  const lastMessage = chatMessages[chatMessages.length - 1];
+  lastMessage.scrollIntoView({ behavior: "smooth", block: "start" });
+}
+</script>
+"""
+# %-style placeholders avoid escaping every JavaScript brace.
+_COPY_BUTTON_TEMPLATE = """
+<button id="%(button_id)s" style="font-size:0.84rem;padding:0.20rem 0.55rem;border-radius:0.45rem;border:1px solid #ccc;background:#f7f7f7;cursor:pointer;">
+  %(label)s
+</button>
+<script>
+const button = document.getElementById("%(button_id)s");
+button.addEventListener("click", async () => {
+  try {
+    await navigator.clipboard.writeText(%(content_json)s);
+    button.textContent = "Copied";
+  } catch (e) {
+    button.textContent = "Copy failed";
+  }
+  setTimeout(() => {
+    button.textContent = %(label_json)s;
+  }, 1200);
+});
+</script>
+"""
+
 _COVER_LETTER_MARKERS = (
     "sehr geehrte",
     "mit freundlichen",
@@ -53,26 +142,135 @@ _COVER_LETTER_MARKERS = (
     "[unternehmen]",
     "[position]",
 )
+# One case-insensitive pass over the text finds every marker occurrence.
+_COVER_LETTER_MARKER_PATTERN = re.compile(
+    "|".join(re.escape(marker) for marker in _COVER_LETTER_MARKERS), re.IGNORECASE
+)
+
+# Phrases that switch the chat back into interview mode, matched without lowercasing.
+_MOCK_INTERVIEW_REQUEST_PATTERN = re.compile(
+    "mock interview|start interview|interview me|start a mock", re.IGNORECASE
+)
 
 
 def _inject_chat_action_button_styles() -> None:
     """Apply compact styling to action buttons rendered inside chat messages."""
 
-    st.markdown(
-        """
-<style>
-div[data-testid="stChatMessage"] div[data-testid="stButton"] > button,
-div[data-testid="stChatMessage"] div[data-testid="stDownloadButton"] > button {
-  font-size: 0.84rem;
-  padding: 0.20rem 0.55rem;
-  min-height: 1.95rem;
-}
-</style>
-        """,
-        unsafe_allow_html=True,
+    st.markdown(_CHAT_ACTION_BUTTON_STYLES, unsafe_allow_html=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_response_pdf(content: str) -> bytes:
+    """Build a response PDF once per distinct message text."""
+
+    return build_response_pdf_bytes(content)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_chat_pdf(transcript: tuple[tuple[str, str], ...]) -> bytes:
+    """Build a transcript PDF once per distinct sequence of (role, content) turns."""
+
+    return build_chat_pdf_bytes(
+        [ChatMessage(role=role, content=content) for role, content in transcript]
     )
 
 
+@functools.cache
+def _cached_variant_labels(prompt_variants: tuple[PromptVariant, ...]) -> dict[str, int]:
+    """Map user-facing variant labels to stable ids once per variant catalog."""
+
+    # Callers treat the shared dict as read-only.
+    return {
+        get_chat_prompt_variant_display_name(variant.id, variant.name): variant.id
+        for variant in prompt_variants
+    }
+
+
+@functools.cache
+def _cached_variant_options(prompt_variants: tuple[PromptVariant, ...]) -> tuple[str, ...]:
+    """Return the variant selectbox labels once per variant catalog."""
+
+    return tuple(_cached_variant_labels(prompt_variants))
+
+
+@functools.lru_cache(maxsize=32)
+def _model_settings_spec(model_name: str) -> tuple[str, tuple[str, ...], int]:
+    """Return the settings widget kind for a model with its options and default index."""
+
+    match get_model_class(model_name):
+        case "chat_default":
+            # The chat-latest model accepts neither temperature nor reasoning effort.
+            return "none", (), 0
+        case "gpt5_reasoning":
+            effort_options = tuple(get_reasoning_effort_options(model_name)) or (
+                DEFAULT_REASONING_EFFORT,
+            )
+            if DEFAULT_REASONING_EFFORT in effort_options:
+                return "effort", effort_options, effort_options.index(DEFAULT_REASONING_EFFORT)
+            return "effort", effort_options, 0
+        case _:
+            return "temperature", (), 0
+
+
+def _stable_block_end(text: str) -> int:
+    """Return where the completed markdown blocks of streamed text end."""
+
+    # Only split on a paragraph break that is not inside an open code fence.
+    end = text.rfind("\n\n")
+    while end > 0 and text.count("```", 0, end) % 2:
+        end = text.rfind("\n\n", 0, end)
+    return max(end, 0)
+
+
+def _build_stream_renderer(placeholder: Any) -> Callable[[str], None]:
+    """Return a delta callback that redraws the placeholder at a throttled rate."""
+
+    parts: list[str] = []
+    last_flush = 0.0
+    # Completed blocks and the trailing block get separate slots so each
+    # flush only re-sends the block that is still growing.
+    blocks = placeholder.container()
+    completed_slot = blocks.empty()
+    pending_slot = blocks.empty()
+    completed = ""
+
+    def _on_delta(delta: str) -> None:
+        nonlocal last_flush, completed
+        parts.append(delta)
+        now = time.monotonic()
+        if now - last_flush < _STREAM_FLUSH_INTERVAL_SECONDS:
+            return
+        last_flush = now
+        # Partial output has not been sanitized yet, so redact before display.
+        text = redact_partial_output("".join(parts))
+        split = _stable_block_end(text)
+        if text[:split] != completed:
+            completed = text[:split]
+            completed_slot.markdown(completed)
+        pending_slot.markdown(text[split:])
+
+    return _on_delta
+
+
+@functools.lru_cache(maxsize=256)
+def _needs_markdown(content: str) -> bool:
+    """Return whether text uses markdown syntax, scanning each message text once."""
+
+    return _MARKDOWN_SYNTAX_PATTERN.search(content) is not None
+
+
+def _render_message_body(content: str, target: Any = st) -> None:
+    """Render a chat turn, skipping markdown parsing for plain text."""
+
+    # Collapse huge responses so their markdown only renders when opened.
+    if len(content) > _COLLAPSE_RESPONSE_CHARS:
+        target = target.expander(f"Show full response ({len(content):,} characters)")
+    if _needs_markdown(content):
+        target.markdown(content)
+    else:
+        target.text(content)
+
+
 def _build_key(prefix: str, name: str) -> str:
     """Build a stable widget/session key scoped to a chat page."""
 
@@ -82,10 +280,11 @@ def _build_key(prefix: str, name: str) -> str:
 def _extract_chat_text(value: Any) -> str:
     """Extract plain text from a chat input value."""
 
-    if value is None:
-        return ""
+    # Plain strings are the common case, so check them before anything else.
     if isinstance(value, str):
         return value
+    if value is None:
+        return ""
     text = getattr(value, "text", "")
     return text if isinstance(text, str) else ""
 
@@ -94,12 +293,20 @@ def _queue_chat_input(
     state: dict,
     chat_input_widget_key: str,
     pending_input_key: str,
+    last_submit_key: str,
 ) -> None:
     """Store submitted chat text in session state for reliable consumption."""
 
     text = _extract_chat_text(state.get(chat_input_widget_key))
-    if text.strip():
-        state[pending_input_key] = text
+    if not text.strip():
+        return
+    # Drop an identical resubmission that arrives within the debounce window.
+    now = time.monotonic()
+    last_text, last_submitted_at = state.get(last_submit_key, ("", 0.0))
+    if text == last_text and now - last_submitted_at < _SUBMIT_DEBOUNCE_SECONDS:
+        return
+    state[last_submit_key] = (text, now)
+    state[pending_input_key] = text
 
 
 def _consume_chat_input(
@@ -134,36 +341,56 @@ def _build_settings_snapshot(
     }
 
 
+def _settings_fingerprint(settings_snapshot: dict[str, str]) -> int:
+    """Collapse a settings snapshot into one int for cheap change detection."""
+
+    return hash(tuple(settings_snapshot.values()))
+
+
 def _build_settings_change_note(settings_snapshot: dict[str, str]) -> str:
     """Build a short note that tells the model settings changed this turn."""
 
+    return _format_settings_change_note(
+        settings_snapshot["selected_label"],
+        settings_snapshot["model_name"],
+        settings_snapshot["temperature"],
+        settings_snapshot["reasoning_effort"],
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _format_settings_change_note(
+    selected_label: str, model_name: str, temperature: str, reasoning_effort: str
+) -> str:
+    """Format the settings note once per distinct combination of settings."""
+
     return (
         "[Configuration update for this response]\n"
-        f"- Interview style: {settings_snapshot['selected_label']}\n"
-        f"- Model: {settings_snapshot['model_name']}\n"
-        f"- Temperature: {settings_snapshot['temperature']}\n"
-        f"- Reasoning effort: {settings_snapshot['reasoning_effort']}\n"
+        f"- Interview style: {selected_label}\n"
+        f"- Model: {model_name}\n"
+        f"- Temperature: {temperature}\n"
+        f"- Reasoning effort: {reasoning_effort}\n"
         "Apply this updated configuration from this response onward."
     )
 
 
-def _prepend_settings_note(history_prompt: str, settings_snapshot: dict[str, str]) -> str:
-    """Prepend a settings update note to the serialized chat history."""
+@functools.lru_cache(maxsize=1)
+def _format_current_date_note(today: date) -> str:
+    """Format the date note once per calendar day."""
+
+    return f"[Current date: {today:%B} {today.day}, {today.year}]"
 
-    note = _build_settings_change_note(settings_snapshot)
-    if history_prompt:
-        return f"{note}\n\n{history_prompt}"
-    return note
 
+def _build_current_date_note() -> str:
+    """Build today's date note so cover-letter generation can use an explicit value."""
 
-def _prepend_current_date_note(history_prompt: str) -> str:
-    """Add today's date so cover-letter generation can use an explicit value."""
+    return _format_current_date_note(date.today())
 
-    current_date = date.today().strftime("%B %d, %Y").replace(" 0", " ")
-    note = f"[Current date: {current_date}]"
-    if history_prompt:
-        return f"{note}\n\n{history_prompt}"
-    return note
+
+def _assemble_prompt(parts: Sequence[str]) -> str:
+    """Join the non-empty prompt sections with blank lines in a single pass."""
+
+    return "\n\n".join(part for part in parts if part)
 
 
 def _format_applied_settings_caption(
@@ -189,59 +416,109 @@ def _format_applied_settings_caption(
 def _looks_like_cover_letter(text: str) -> bool:
     """Return True when assistant text resembles a cover letter."""
 
-    lowered = text.lower()
-    marker_hits = sum(1 for marker in _COVER_LETTER_MARKERS if marker in lowered)
-    if marker_hits >= 2:
-        return True
-    # Handle short letters that still include a greeting and closing.
-    if "sehr geehrte" in lowered and "mit freundlichen" in lowered:
-        return True
+    # Two distinct markers are enough; a greeting plus closing also counts as two.
+    seen_markers: set[str] = set()
+    for match in _COVER_LETTER_MARKER_PATTERN.finditer(text):
+        seen_markers.add(match.group().lower())
+        if len(seen_markers) >= 2:
+            return True
     return False
 
 
 def _is_mock_interview_request(user_input: str) -> bool:
     """Return True when user requests an interview-mode switch."""
 
-    lowered = user_input.lower()
-    return any(
-        phrase in lowered
-        for phrase in (
-            "mock interview",
-            "start interview",
-            "interview me",
-            "start a mock",
-        )
-    )
+    return _MOCK_INTERVIEW_REQUEST_PATTERN.search(user_input) is not None
+
+
+def _prompt_window_start(
+    messages: list[ChatMessage], previous_start: int, high_chars: int, low_chars: int
+) -> int:
+    """Keep the prompt window's oldest turn until the window exceeds high_chars.
+
+    Overflow cuts the window down to low_chars in one step, so the serialized
+    prefix stays identical across several turns instead of shifting every send.
+    """
 
+    start = previous_start if 0 <= previous_start <= len(messages) else 0
+    if sum(len(message.content) for message in messages[start:]) <= high_chars:
+        return start
+    low_start = compute_trim_start(messages, low_chars)
+    if low_start < len(messages):
+        return low_start
+    # A newest turn longer than low_chars still goes in when it fits high_chars.
+    return compute_trim_start(messages, high_chars)
 
-def _build_prompt_history(messages: list[ChatMessage], max_chars: int) -> str:
+
+def _build_prompt_history(
+    messages: list[ChatMessage],
+    max_chars: int,
+    transcript_lines: list[str] | None = None,
+    start: int | None = None,
+) -> str:
     """Serialize chat history for prompting without mutating stored transcript."""
 
-    # Copy messages so trimming does not remove items from the visible chat/export history.
-    prompt_messages = [
-        ChatMessage(role=message.role, content=message.content, message_type=message.message_type)
-        for message in messages
-    ]
-    trim_chat_history(prompt_messages, max_chars=max_chars)
-    return _history_to_prompt(prompt_messages)
+    # Slice the newest turns that fit so the visible chat/export history stays intact.
+    if start is None:
+        start = compute_trim_start(messages, max_chars)
+    if transcript_lines is None:
+        return _history_to_prompt(messages[start:])
+    # Reuse cached serialized turns for the messages inside the window.
+    kept_count = len(messages) - start
+    return "\n".join(transcript_lines[len(transcript_lines) - kept_count :]).strip()
+
+
+def _recent_assistant_start(messages: list[ChatMessage], count: int) -> int:
+    """Return the index of the oldest assistant turn among the latest ``count``."""
+
+    seen = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].role == "assistant":
+            seen += 1
+            if seen == count:
+                return index
+    return 0
+
+
+def _history_render_start(message_count: int, show_full_history: bool) -> int:
+    """Return the index of the first turn to render in the chat history."""
+
+    if show_full_history:
+        return 0
+    return max(message_count - _HISTORY_RENDER_WINDOW, 0)
+
+
+def _sync_transcript_lines(
+    state: dict,
+    transcript_key: str,
+    messages: list[ChatMessage],
+) -> list[str]:
+    """Return cached transcript lines for the history, serializing only new turns."""
+
+    lines = state.get(transcript_key)
+    # Re-derive from scratch when the cache is missing or no longer matches the history.
+    if (
+        not isinstance(lines, list)
+        or len(lines) > len(messages)
+        or (lines and lines[-1] != _format_transcript_line(messages[len(lines) - 1]))
+    ):
+        lines = []
+        state[transcript_key] = lines
+    lines.extend(_format_transcript_line(message) for message in messages[len(lines) :])
+    return lines
 
 
 def _scroll_to_latest_assistant_message_top() -> None:
     """Scroll viewport to the top of the latest assistant message."""
 
-    components.html(
-        """
-<script>
-const doc = window.parent.document;
-const chatMessages = doc.querySelectorAll('[data-testid="stChatMessage"]');
-if (chatMessages.length > 0) {
-  const lastMessage = chatMessages[chatMessages.length - 1];
-  lastMessage.scrollIntoView({ behavior: "smooth", block: "start" });
-}
-</script>
-        """,
-        height=0,
-    )
+    components.html(_SCROLL_TO_LATEST_SCRIPT, height=0)
+
+
+def _script_json(value: str) -> str:
+    """Encode text as JSON that is safe to embed inside an inline <script>."""
+
+    # Escape "</" so content such as "</script>" cannot close the script block.
+    return dumps_json(value).replace("</", "<\\/")
 
 
 def _render_copy_button(
@@ -252,29 +529,15 @@ def _render_copy_button(
 ) -> None:
     """Render a browser-side copy-to-clipboard button for arbitrary text."""
 
-    button_id = f"copy_{hashlib.sha1(element_key.encode('utf-8')).hexdigest()[:12]}"
-    button_label_json = json.dumps(label)
-    content_json = json.dumps(content)
-    html = f"""
-<button id="{button_id}" style="font-size:0.84rem;padding:0.20rem 0.55rem;border-radius:0.45rem;border:1px solid #ccc;background:#f7f7f7;cursor:pointer;">
-  {label}
-</button>
-<script>
-const button = document.getElementById("{button_id}");
-button.addEventListener("click", async () => {{
-  const original = button.textContent;
-  try {{
-    await navigator.clipboard.writeText({content_json});
-    button.textContent = "Copied";
-  }} catch (e) {{
-    button.textContent = "Copy failed";
-  }}
-  setTimeout(() => {{
-    button.textContent = JSON.parse({button_label_json});
-  }}, 1200);
-}});
-</script>
-"""
+    button_id = f"copy_{hashlib.blake2b(element_key.encode('utf-8'), digest_size=6).hexdigest()}"
+    button_label_json = _script_json(label)
+    content_json = _script_json(content)
+    html = _COPY_BUTTON_TEMPLATE % {
+        "button_id": button_id,
+        "label": label,
+        "label_json": button_label_json,
+        "content_json": content_json,
+    }
     components.html(html, height=38)
 
 
@@ -285,12 +548,32 @@ def _render_assistant_message_actions(
     latest_assistant_index: int,
     all_messages: list[ChatMessage],
     state_key_prefix: str,
+    collapsed: bool = False,
 ) -> bool:
     """Render copy/download actions for assistant messages."""
 
+    response_pdf_kwargs = {
+        # Build the PDF only when clicked; the cache serves repeat downloads.
+        "data": functools.partial(_cached_response_pdf, message.content),
+        "file_name": f"assistant_response_{message_index + 1}.pdf",
+        "mime": "application/pdf",
+        "key": _build_key(state_key_prefix, f"response_pdf_{message_index}"),
+    }
+    if collapsed:
+        # Expander bodies are always sent, so older turns only repeat their text as a
+        # copyable code block (instead of one iframe each) when it is asked for.
+        if st.toggle(
+            "Show text to copy",
+            key=_build_key(state_key_prefix, f"show_copy_text_{message_index}"),
+        ):
+            st.code(message.content, language=None, wrap_lines=True)
+        st.download_button("Download Response (PDF)", **response_pdf_kwargs)
+        return False
+
     # Keep controls attached to the latest assistant message for better discoverability.
     is_latest = message_index == latest_assistant_index
-    action_cols = st.columns([1, 1, 1, 1] if is_latest else [1, 1, 2, 0.01])
+    # Tuple literals are compile-time constants, so no list is built per turn.
+    action_cols = st.columns((1, 1, 1, 1) if is_latest else (1, 1, 2, 0.01))
     with action_cols[0]:
         _render_copy_button(
             label="Copy response",
@@ -298,13 +581,7 @@ def _render_assistant_message_actions(
             element_key=_build_key(state_key_prefix, f"copy_response_{message_index}"),
         )
     with action_cols[1]:
-        st.download_button(
-            "Download Response (PDF)",
-            data=build_response_pdf_bytes(message.content),
-            file_name=f"assistant_response_{message_index + 1}.pdf",
-            mime="application/pdf",
-            key=_build_key(state_key_prefix, f"response_pdf_{message_index}"),
-        )
+        st.download_button("Download Response (PDF)", **response_pdf_kwargs)
     if is_latest:
         with action_cols[2]:
             summary_requested = st.button(
@@ -314,7 +591,10 @@ def _render_assistant_message_actions(
         with action_cols[3]:
             st.download_button(
                 "Download Full Chat (PDF)",
-                data=build_chat_pdf_bytes(all_messages),
+                data=functools.partial(
+                    _cached_chat_pdf,
+                    tuple((turn.role, turn.content) for turn in all_messages),
+                ),
                 file_name="interview_chat_transcript.pdf",
                 mime="application/pdf",
                 key=_build_key(state_key_prefix, f"chat_pdf_button_{message_index}"),
@@ -344,27 +624,29 @@ def _build_payload(
     )
 
 
+def _format_transcript_line(message: ChatMessage) -> str:
+    """Serialize a single chat turn into the transcript line format."""
+
+    return _TRANSCRIPT_ROLE_PREFIXES.get(message.role, "Assistant: ") + message.content
+
+
 def _history_to_prompt(messages: list[ChatMessage]) -> str:
     """Serialize chat history into a single prompt string."""
 
     # Convert chat turns into a simple transcript format.
-    lines: list[str] = []
-    for message in messages:
-        role = "User" if message.role == "user" else "Assistant"
-        lines.append(f"{role}: {message.content}")
-    return "\n".join(lines).strip()
+    return "\n".join([_format_transcript_line(message) for message in messages]).strip()
 
 
 def render_chat_ui(
     *,
     page_title: str,
     caption: str,
-    prompt_variants: list,
+    prompt_variants: Sequence[PromptVariant],
     prompt_label: str,
     state_key_prefix: str,
-    generate_response: Callable[[RequestPayload], tuple[bool, str]],
-    generate_cover_letter: Callable[[RequestPayload], tuple[bool, str]],
-    generate_summary: Callable[[RequestPayload], tuple[bool, str]],
+    generate_response: Callable[..., tuple[bool, str]],
+    generate_cover_letter: Callable[..., tuple[bool, str]],
+    generate_summary: Callable[..., tuple[bool, str]],
 ) -> None:
     """Render a chat UI with pluggable backend response generation."""
 
@@ -373,47 +655,41 @@ def render_chat_ui(
     _inject_chat_action_button_styles()
 
     # Build clear user-facing labels while keeping stable numeric IDs in payloads.
-    variant_options: list[tuple[str, int]] = []
-    for variant in prompt_variants:
-        variant_options.append(
-            (
-                get_chat_prompt_variant_display_name(variant.id, variant.name),
-                variant.id,
-            )
-        )
-    variant_labels = {label: variant_id for label, variant_id in variant_options}
-    variant_ids = [variant_id for _, variant_id in variant_options]
-    default_variant_index = (
-        variant_ids.index(DEFAULT_CHAT_PROMPT_VARIANT_ID)
-        if DEFAULT_CHAT_PROMPT_VARIANT_ID in variant_ids
-        else 0
+    # tuple() returns the same object when the caller already passes a tuple.
+    variant_catalog = tuple(prompt_variants)
+    variant_labels = _cached_variant_labels(variant_catalog)
+    # The catalog comes from the page, so locate its default among the cached labels.
+    default_variant_index = next(
+        (
+            position
+            for position, variant_id in enumerate(variant_labels.values())
+            if variant_id == DEFAULT_CHAT_PROMPT_VARIANT_ID
+        ),
+        0,
     )
     # Scope widget/session keys so each chat page can keep independent state.
     model_key = _build_key(state_key_prefix, "model")
     variant_key = _build_key(state_key_prefix, "variant")
     reasoning_key = _build_key(state_key_prefix, "reasoning_effort")
     temperature_key = _build_key(state_key_prefix, "temperature")
-    chat_input_widget_key = _build_key(state_key_prefix, "chat_input")
-    pending_input_key = _build_key(state_key_prefix, "pending_chat_input")
-    cover_letter_button_key = _build_key(state_key_prefix, "cover_letter_button")
-    last_applied_settings_key = _build_key(state_key_prefix, "last_applied_settings")
-    cover_letter_context_key = _build_key(state_key_prefix, "cover_letter_context_active")
-    # Load the supported model list so the UI stays in sync with the backend.
-    allowed_models = get_allowed_models()
+    job_description_key = _build_key(state_key_prefix, "job_description")
+    cv_text_key = _build_key(state_key_prefix, "cv_text")
 
     # Place JD and CV side-by-side at the top to match the classic layout.
     col_left, col_right = st.columns(2)
     with col_left:
-        job_description = st.text_area(
+        st.text_area(
             "Job Description (optional)",
             height=220,
             placeholder="Paste the target role description here.",
+            key=job_description_key,
         )
     with col_right:
-        cv_text = st.text_area(
+        st.text_area(
             "CV / Resume (optional)",
             height=220,
             placeholder="Paste your CV or resume here.",
+            key=cv_text_key,
         )
 
     # Collect settings below the JD/CV inputs in a single row.
@@ -421,16 +697,14 @@ def render_chat_ui(
     with settings_left:
         model_name = st.selectbox(
             "Model",
-            options=allowed_models,
-            index=allowed_models.index(DEFAULT_MODEL)
-            if DEFAULT_MODEL in allowed_models
-            else 0,
+            options=_ALLOWED_MODELS,
+            index=_DEFAULT_MODEL_INDEX,
             key=model_key,
         )
     with settings_mid:
         selected_label = st.selectbox(
             prompt_label,
-            options=[label for label, _ in variant_options],
+            options=_cached_variant_options(variant_catalog),
             index=default_variant_index,
             key=variant_key,
         )
@@ -440,18 +714,16 @@ def render_chat_ui(
         if variant_description:
             st.caption(variant_description)
     with settings_right:
-        if model_name == "gpt-5.2-chat-latest":
-            st.empty()
+        settings_kind, effort_options, default_effort_index = _model_settings_spec(model_name)
+        if settings_kind == "none":
+            # Leave the column blank; the chat-latest model has no tuning controls.
             reasoning_effort = None
             temperature = None
-        elif is_gpt5_model(model_name):
-            effort_options = get_reasoning_effort_options(model_name)
+        elif settings_kind == "effort":
             reasoning_effort = st.selectbox(
                 "Reasoning effort",
-                options=effort_options or [DEFAULT_REASONING_EFFORT],
-                index=(effort_options or [DEFAULT_REASONING_EFFORT]).index(
-                    DEFAULT_REASONING_EFFORT
-                ),
+                options=effort_options,
+                index=default_effort_index,
                 key=reasoning_key,
             )
             temperature = None
@@ -477,26 +749,103 @@ def render_chat_ui(
 
     st.divider()
 
+    _render_chat_section(
+        job_description_key=job_description_key,
+        cv_text_key=cv_text_key,
+        selected_label=selected_label,
+        selected_variant_id=selected_variant_id,
+        model_name=model_name,
+        temperature=temperature,
+        reasoning_effort=reasoning_effort,
+        settings_snapshot=settings_snapshot,
+        state_key_prefix=state_key_prefix,
+        generate_response=generate_response,
+        generate_cover_letter=generate_cover_letter,
+        generate_summary=generate_summary,
+    )
+
+
+@st.fragment
+def _render_chat_section(
+    *,
+    job_description_key: str,
+    cv_text_key: str,
+    selected_label: str,
+    selected_variant_id: int,
+    model_name: str,
+    temperature: float | None,
+    reasoning_effort: str | None,
+    settings_snapshot: dict[str, str],
+    state_key_prefix: str,
+    generate_response: Callable[..., tuple[bool, str]],
+    generate_cover_letter: Callable[..., tuple[bool, str]],
+    generate_summary: Callable[..., tuple[bool, str]],
+) -> None:
+    """Render chat history, input, and responses as a fragment.
+
+    Chat submissions and message actions rerun only this section; changes to the
+    settings widgets above still rerun the whole page with fresh arguments, and the
+    JD/CV text is read from its widget keys on every run.
+    """
+
+    chat_input_widget_key = _build_key(state_key_prefix, "chat_input")
+    pending_input_key = _build_key(state_key_prefix, "pending_chat_input")
+    cover_letter_button_key = _build_key(state_key_prefix, "cover_letter_button")
+    last_applied_settings_key = _build_key(state_key_prefix, "last_applied_settings")
+    cover_letter_context_key = _build_key(state_key_prefix, "cover_letter_context_active")
+    transcript_key = _build_key(state_key_prefix, "transcript_lines")
+    show_full_history_key = _build_key(state_key_prefix, "show_full_history")
+    prompt_window_key = _build_key(state_key_prefix, "prompt_window_start")
+    # Resolve the session state proxy once; every read and write below goes through it.
+    session_state = st.session_state
+    # Read JD/CV from widget state so fragment reruns always see the latest text.
+    job_description = session_state.get(job_description_key, "")
+    cv_text = session_state.get(cv_text_key, "")
+
     # Initialize or retrieve chat history from session state.
-    messages = init_chat_history(st.session_state)
-    assistant_indices = [idx for idx, msg in enumerate(messages) if msg.role == "assistant"]
-    latest_assistant_index = assistant_indices[-1] if assistant_indices else -1
+    messages = init_chat_history(session_state)
+    # Scan backwards; only the newest assistant turn is needed.
+    latest_assistant_index = next(
+        (idx for idx in range(len(messages) - 1, -1, -1) if messages[idx].role == "assistant"),
+        -1,
+    )
 
-    # Render existing conversation turns in order.
+    # Render existing conversation turns in order, sharing one container per
+    # run of same-role turns (e.g. a reply followed by a summary).
     summary_requested = False
-    for index, message in enumerate(messages):
-        with st.chat_message(message.role):
-            st.markdown(message.content)
-            if message.role == "assistant":
+    # Older assistant turns keep their actions behind a collapsed expander.
+    full_actions_start = _recent_assistant_start(messages, _FULL_ACTION_TURNS)
+    # Long sessions render only the newest turns until earlier ones are requested.
+    render_start = _history_render_start(
+        len(messages), session_state.get(show_full_history_key, False)
+    )
+    if render_start:
+        st.button(
+            f"Show {render_start} earlier messages",
+            key=_build_key(state_key_prefix, "show_full_history_button"),
+            on_click=session_state.__setitem__,
+            args=(show_full_history_key, True),
+        )
+    visible_turns = enumerate(messages[render_start:], render_start)
+    for role, turns in itertools.groupby(visible_turns, key=lambda turn: turn[1].role):
+        with st.chat_message(role):
+            for index, message in turns:
+                _render_message_body(message.content)
+                if role != "assistant":
+                    continue
+                action_kwargs = {
+                    "message": message,
+                    "message_index": index,
+                    "latest_assistant_index": latest_assistant_index,
+                    "all_messages": messages,
+                    "state_key_prefix": state_key_prefix,
+                }
+                if index < full_actions_start:
+                    with st.expander("Actions"):
+                        _render_assistant_message_actions(**action_kwargs, collapsed=True)
+                    continue
                 summary_requested = (
-                    _render_assistant_message_actions(
-                        message=message,
-                        message_index=index,
-                        latest_assistant_index=latest_assistant_index,
-                        all_messages=messages,
-                        state_key_prefix=state_key_prefix,
-                    )
-                    or summary_requested
+                    _render_assistant_message_actions(**action_kwargs) or summary_requested
                 )
 
     # Keep cover letter generation available as a primary action.
@@ -518,245 +867,165 @@ def render_chat_ui(
         key=chat_input_widget_key,
         on_submit=_queue_chat_input,
         kwargs={
-            "state": st.session_state,
+            "state": session_state,
             "chat_input_widget_key": chat_input_widget_key,
             "pending_input_key": pending_input_key,
+            "last_submit_key": _build_key(state_key_prefix, "last_submit"),
         },
     )
     user_input = _consume_chat_input(
-        st.session_state, pending_input_key, direct_chat_input
+        session_state, pending_input_key, direct_chat_input
     )
     has_user_input = bool(user_input.strip())
 
     if not has_user_input and not cover_letter_requested and not summary_requested:
         return
 
+    # Rate limit per session first so rejected turns skip all other work.
+    rate_limit_key = session_state.get("rate_limit_key")
+    if rate_limit_key is None:
+        rate_limit_key = session_state["rate_limit_key"] = secrets.token_hex(8)
+    ok, refusal = check_rate_limit(rate_limit_key)
+    if not ok:
+        _LOGGER.info("chat_rate_limited")
+        st.error(refusal or "Too many requests. Please try again.")
+        return
+
     # Detect whether settings changed since the previous sent request.
-    last_applied_settings = st.session_state.get(last_applied_settings_key)
+    last_applied_settings = session_state.get(last_applied_settings_key)
+    settings_fingerprint = _settings_fingerprint(settings_snapshot)
     settings_changed = (
-        isinstance(last_applied_settings, dict)
-        and last_applied_settings != settings_snapshot
+        isinstance(last_applied_settings, int)
+        and last_applied_settings != settings_fingerprint
     )
     # Mark current settings as the ones used for this submitted turn.
-    st.session_state[last_applied_settings_key] = settings_snapshot
+    session_state[last_applied_settings_key] = settings_fingerprint
+    settings_note = _build_settings_change_note(settings_snapshot) if settings_changed else ""
 
     # Record a request-level log entry without exposing user content.
-    log_event = "chat_message_received"
-    if cover_letter_requested:
-        log_event = "cover_letter_button_clicked"
-    elif summary_requested:
-        log_event = "chat_summary_button_clicked"
-    _LOGGER.info(
-        log_event,
-        extra={
-            "job_description_length": len(job_description),
-            "cv_text_length": len(cv_text),
-            "user_prompt_length": len(user_input or ""),
-            "selected_variant": selected_label,
-            "selected_variant_id": selected_variant_id,
-            "temperature": temperature if temperature is not None else "default",
-            "reasoning_effort": reasoning_effort or "default",
-            "model_name": model_name,
-            "settings_changed": settings_changed,
-        },
-    )
-    # Emit a plain log line so active settings are visible with the default formatter.
-    _LOGGER.info(
-        "chat_request_settings model=%s variant_id=%s variant_label=%s temperature=%s reasoning_effort=%s settings_changed=%s",
-        model_name,
-        selected_variant_id,
-        selected_label,
-        settings_snapshot["temperature"],
-        settings_snapshot["reasoning_effort"],
-        settings_changed,
-    )
-
-    # Rate limit per session to prevent accidental rapid-fire requests.
-    if "rate_limit_key" not in st.session_state:
-        st.session_state["rate_limit_key"] = str(uuid.uuid4())
-    ok, refusal = check_rate_limit(st.session_state["rate_limit_key"])
-    if not ok:
-        _LOGGER.info("chat_rate_limited")
-        st.error(refusal or "Too many requests. Please try again.")
-        return
+    # Skip building the metadata dict entirely when INFO logging is disabled.
+    if _LOGGER.isEnabledFor(logging.INFO):
+        log_event = "chat_message_received"
+        if cover_letter_requested:
+            log_event = "cover_letter_button_clicked"
+        elif summary_requested:
+            log_event = "chat_summary_button_clicked"
+        _LOGGER.info(
+            log_event,
+            extra={
+                "job_description_length": len(job_description),
+                "cv_text_length": len(cv_text),
+                "user_prompt_length": len(user_input or ""),
+                "selected_variant": selected_label,
+                "selected_variant_id": selected_variant_id,
+                "temperature": temperature if temperature is not None else "default",
+                "reasoning_effort": reasoning_effort or "default",
+                "model_name": model_name,
+                "settings_changed": settings_changed,
+            },
+        )
+        # Emit a plain log line so active settings are visible with the default formatter.
+        _LOGGER.info(
+            "chat_request_settings model=%s variant_id=%s variant_label=%s temperature=%s reasoning_effort=%s settings_changed=%s",
+            model_name,
+            selected_variant_id,
+            selected_label,
+            settings_snapshot["temperature"],
+            settings_snapshot["reasoning_effort"],
+            settings_changed,
+        )
 
-    # Append the user message and build a prompt snapshot for the model.
+    # Append the user message and pick which kind of reply to generate.
     if has_user_input:
+        generation_kind = "chat"
         user_requested_mock = _is_mock_interview_request(user_input)
         if user_requested_mock:
-            st.session_state[cover_letter_context_key] = False
-        cover_letter_context_active = bool(
-            st.session_state.get(cover_letter_context_key, False)
+            session_state[cover_letter_context_key] = False
+        # Follow-ups keep counting as cover letters until a mock interview is requested.
+        continue_cover_letter = (
+            bool(session_state.get(cover_letter_context_key, False)) and not user_requested_mock
         )
-
         append_chat_message(messages, role="user", content=user_input, message_type="user")
-        history_prompt = _build_prompt_history(messages, max_chars=_MAX_HISTORY_CHARS)
-        if settings_changed:
-            history_prompt = _prepend_settings_note(history_prompt, settings_snapshot)
 
         # Show the user message in the chat UI.
         with st.chat_message("user"):
-            st.markdown(user_input)
-
-        payload = _build_payload(
-            job_description=job_description,
-            cv_text=cv_text,
-            user_prompt=history_prompt,
-            prompt_variant_id=selected_variant_id,
-            temperature=temperature,
-            model_name=model_name,
-            reasoning_effort=reasoning_effort,
-        )
-
-        # Generate the assistant response and render it in the chat.
-        with st.chat_message("assistant"):
-            with st.spinner("Drafting response..."):
-                ok, response = generate_response(payload)
-
-            if not ok:
-                _LOGGER.info("chat_request_blocked")
-                st.error(response)
-                append_chat_message(
-                    messages, role="assistant", content=str(response), message_type="chat"
-                )
-                return
-
-            content = str(response)
-            response_is_cover_letter = _looks_like_cover_letter(content) or (
-                cover_letter_context_active and not user_requested_mock
-            )
-            response_message_type = "cover_letter" if response_is_cover_letter else "chat"
-            if response_is_cover_letter:
-                st.session_state[cover_letter_context_key] = True
-
-            append_chat_message(
-                messages,
-                role="assistant",
-                content=content,
-                message_type=response_message_type,
-            )
-            response_index = len(messages) - 1
-            st.markdown(content)
-            st.caption(
-                _format_applied_settings_caption(
-                    model_name=model_name,
-                    selected_label=selected_label,
-                    temperature=temperature,
-                    reasoning_effort=reasoning_effort,
-                )
-            )
-            _render_assistant_message_actions(
-                message=messages[response_index],
-                message_index=response_index,
-                latest_assistant_index=response_index,
-                all_messages=messages,
-                state_key_prefix=state_key_prefix,
-            )
-            _scroll_to_latest_assistant_message_top()
-            _LOGGER.info("chat_request_success")
-        return
-
-    # Generate a summary using the existing chat history.
-    if summary_requested:
-        history_prompt = _build_prompt_history(
-            messages, max_chars=_MAX_SUMMARY_HISTORY_CHARS
-        )
-        if settings_changed:
-            history_prompt = _prepend_settings_note(history_prompt, settings_snapshot)
-        payload = _build_payload(
-            job_description=job_description,
-            cv_text=cv_text,
-            user_prompt=history_prompt,
-            prompt_variant_id=selected_variant_id,
-            temperature=temperature,
-            model_name=model_name,
-            reasoning_effort=reasoning_effort,
+            _render_message_body(user_input)
+    elif summary_requested:
+        generation_kind = "summary"
+    else:
+        generation_kind = "cover_letter"
+    spinner_text, log_prefix, max_history_chars = _GENERATION_SPECS[generation_kind]
+
+    # Build the prompt from the shared history plus any per-turn notes.
+    history_start = None
+    if generation_kind != "summary":
+        history_start = _prompt_window_start(
+            messages,
+            session_state.get(prompt_window_key, 0),
+            high_chars=max_history_chars,
+            low_chars=_HISTORY_LOW_WATER_CHARS,
         )
-
-        with st.chat_message("assistant"):
-            with st.spinner("Summarizing chat..."):
-                ok, response = generate_summary(payload)
-
-            if not ok:
-                _LOGGER.info("chat_summary_request_blocked")
-                st.error(response)
-                append_chat_message(
-                    messages,
-                    role="assistant",
-                    content=str(response),
-                    message_type="summary",
-                )
-                return
-
-            content = str(response)
-            append_chat_message(
-                messages,
-                role="assistant",
-                content=content,
-                message_type="summary",
-            )
-            response_index = len(messages) - 1
-            st.markdown(content)
-            st.caption(
-                _format_applied_settings_caption(
-                    model_name=model_name,
-                    selected_label=selected_label,
-                    temperature=temperature,
-                    reasoning_effort=reasoning_effort,
-                )
-            )
-            _render_assistant_message_actions(
-                message=messages[response_index],
-                message_index=response_index,
-                latest_assistant_index=response_index,
-                all_messages=messages,
-                state_key_prefix=state_key_prefix,
-            )
-            _scroll_to_latest_assistant_message_top()
-            _LOGGER.info("chat_summary_request_success")
-        return
-
-    # Generate a cover letter using the existing chat history.
-    history_prompt = _build_prompt_history(messages, max_chars=_MAX_HISTORY_CHARS)
-    history_prompt = _prepend_current_date_note(history_prompt)
-    if settings_changed:
-        history_prompt = _prepend_settings_note(history_prompt, settings_snapshot)
+        session_state[prompt_window_key] = history_start
+    history_prompt = _build_prompt_history(
+        messages,
+        max_chars=max_history_chars,
+        transcript_lines=_sync_transcript_lines(session_state, transcript_key, messages),
+        start=history_start,
+    )
+    date_note = _build_current_date_note() if generation_kind == "cover_letter" else ""
     payload = _build_payload(
         job_description=job_description,
         cv_text=cv_text,
-        user_prompt=history_prompt,
+        user_prompt=_assemble_prompt((settings_note, date_note, history_prompt)),
         prompt_variant_id=selected_variant_id,
         temperature=temperature,
         model_name=model_name,
         reasoning_effort=reasoning_effort,
     )
 
-    # Generate the cover letter and render it in the chat.
+    # Generate the assistant reply and render it in the chat.
     with st.chat_message("assistant"):
-        with st.spinner("Drafting cover letter..."):
-            ok, response = generate_cover_letter(payload)
+        generate = {
+            "chat": generate_response,
+            "summary": generate_summary,
+            "cover_letter": generate_cover_letter,
+        }[generation_kind]
+        # Stream deltas into a placeholder that the final response replaces.
+        response_placeholder = st.empty()
+        with st.spinner(spinner_text):
+            ok, response = generate(
+                payload, on_delta=_build_stream_renderer(response_placeholder)
+            )
 
         if not ok:
-            _LOGGER.info("cover_letter_request_blocked")
+            _LOGGER.info(f"{log_prefix}_blocked")
+            response_placeholder.empty()
             st.error(response)
             append_chat_message(
                 messages,
                 role="assistant",
                 content=str(response),
-                message_type="chat",
+                message_type="summary" if generation_kind == "summary" else "chat",
             )
             return
 
         content = str(response)
-        st.session_state[cover_letter_context_key] = True
+        response_message_type = generation_kind
+        if generation_kind == "chat" and (
+            continue_cover_letter or _looks_like_cover_letter(content)
+        ):
+            response_message_type = "cover_letter"
+        if response_message_type == "cover_letter":
+            session_state[cover_letter_context_key] = True
+
         append_chat_message(
             messages,
             role="assistant",
             content=content,
-            message_type="cover_letter",
+            message_type=response_message_type,
         )
         response_index = len(messages) - 1
-        st.markdown(content)
+        _render_message_body(content, response_placeholder)
         st.caption(
             _format_applied_settings_caption(
                 model_name=model_name,
@@ -773,4 +1042,4 @@ def render_chat_ui(
             state_key_prefix=state_key_prefix,
         )
         _scroll_to_latest_assistant_message_top()
-        _LOGGER.info("cover_letter_request_success")
+        _LOGGER.info(f"{log_prefix}_success")
@@ -10,15 +10,17 @@ from app.core.langchain_client import (
 from app.core.prompts import get_chat_prompt_variants
 from app.ui.chat_ui_common import render_chat_ui
 
+# The chat catalog is static, so build the tuple once instead of on every rerun.
+_CHAT_PROMPT_VARIANTS = tuple(get_chat_prompt_variants())
+
 
 def render_langchain_chat_ui() -> None:
     """Render the LangChain chat experience without setting page config."""
 
-    variants = get_chat_prompt_variants()
     render_chat_ui(
         page_title="Interview Preparation Chat",
         caption="Chat with the app for coaching, feedback, and practice questions.",
-        prompt_variants=variants,
+        prompt_variants=_CHAT_PROMPT_VARIANTS,
         prompt_label="Interview style",
         state_key_prefix="langchain_chat",
         generate_response=generate_langchain_chat_response,
@@ -0,0 +1,259 @@
+"""Shared single-shot question generator UI rendering helpers."""
+
+from __future__ import annotations
+
+import logging
+import secrets
+import time
+from collections.abc import Callable, MutableMapping
+from typing import Any
+
+import streamlit as st
+
+from app.core.dataclasses import RequestPayload
+from app.core.model_catalog import (
+    DEFAULT_MODEL,
+    DEFAULT_REASONING_EFFORT,
+    get_allowed_models,
+    get_model_class,
+    get_reasoning_effort_options,
+)
+from app.core.prompts import (
+    DEFAULT_PROMPT_VARIANT_ID,
+    get_prompt_variant_description,
+    get_prompt_variant_display_name,
+    get_prompt_variants,
+)
+from app.core.safety import check_rate_limit
+from app.core.structured_output import render_markdown_from_response
+
+_LOGGER = logging.getLogger(__name__)
+
+# An identical submit this soon after a result is a double click, not a new request.
+_DUPLICATE_SUBMIT_SECONDS = 2.0
+
+# The prompt and model catalogs are static, so snapshot them once per process.
+_ALLOWED_MODELS = tuple(get_allowed_models())
+_DEFAULT_MODEL_INDEX = (
+    _ALLOWED_MODELS.index(DEFAULT_MODEL) if DEFAULT_MODEL in _ALLOWED_MODELS else 0
+)
+# Map clear user-facing labels to the stable numeric IDs used in payloads.
+_VARIANT_LABELS = {
+    get_prompt_variant_display_name(variant.id, variant.name): variant.id
+    for variant in get_prompt_variants()
+}
+_VARIANT_LABEL_OPTIONS = tuple(_VARIANT_LABELS)
+_DEFAULT_VARIANT_INDEX = (
+    list(_VARIANT_LABELS.values()).index(DEFAULT_PROMPT_VARIANT_ID)
+    if DEFAULT_PROMPT_VARIANT_ID in _VARIANT_LABELS.values()
+    else 0
+)
+
+
+def _build_payload(
+    job_description: str,
+    cv_text: str,
+    user_prompt: str,
+    prompt_variant_id: int,
+    temperature: float | None,
+    model_name: str,
+    reasoning_effort: str | None,
+) -> RequestPayload:
+    # Bundle raw UI inputs into a typed payload for the controller.
+    return RequestPayload(
+        job_description=job_description,
+        cv_text=cv_text,
+        user_prompt=user_prompt,
+        prompt_variant_id=prompt_variant_id,
+        temperature=temperature,
+        model_name=model_name,
+        reasoning_effort=reasoning_effort,
+    )
+
+
+def _recent_duplicate_result(
+    state: MutableMapping[str, Any], result_key: str, payload: RequestPayload
+) -> tuple[bool, dict[str, object] | str] | None:
+    """Return the stored result when the same payload was just answered."""
+
+    stored = state.get(result_key)
+    if stored is None:
+        return None
+    stored_payload, stored_at, result = stored
+    if stored_payload != payload or time.monotonic() - stored_at > _DUPLICATE_SUBMIT_SECONDS:
+        return None
+    return result
+
+
+def render_questions_ui(
+    *,
+    form_key: str,
+    log_prefix: str,
+    generate_questions: Callable[[RequestPayload], tuple[bool, dict[str, object] | str]],
+) -> None:
+    """Render the single-shot question generator without resetting page config."""
+
+    st.title("Interview Practice App")
+    st.caption("Generate tailored interview questions from your JD, CV, and focus areas.")
+
+    # Keep model selection outside the form so the settings react immediately.
+    model_name = st.selectbox(
+        "Model",
+        options=_ALLOWED_MODELS,
+        index=_DEFAULT_MODEL_INDEX,
+    )
+
+    with st.form(form_key):
+        # Place JD and CV side-by-side at the top for easy comparison.
+        col_left, col_right = st.columns(2)
+        with col_left:
+            # Capture JD input on the left to match typical reading order.
+            job_description = st.text_area(
+                "Job Description (optional)",
+                height=220,
+                placeholder="Paste the target role description here.",
+            )
+        with col_right:
+            # Capture CV input on the right so both documents stay visible.
+            cv_text = st.text_area(
+                "CV / Resume (optional)",
+                height=220,
+                placeholder="Paste your CV or resume here.",
+            )
+
+        # Collect settings below the JD/CV inputs in a single row.
+        # The third column stays empty so the settings keep a third of the row each.
+        settings_left, settings_mid, _ = st.columns(3)
+        with settings_left:
+            # Prompt variant stays visible next to the model selector.
+            selected_label = st.selectbox(
+                "Interview style",
+                options=_VARIANT_LABEL_OPTIONS,
+                index=_DEFAULT_VARIANT_INDEX,
+            )
+            selected_variant_id = _VARIANT_LABELS[selected_label]
+            # Keep a short explanation near the selector to clarify each mode.
+            variant_description = get_prompt_variant_description(selected_variant_id)
+            if variant_description:
+                st.caption(variant_description)
+        with settings_mid:
+            model_class = get_model_class(model_name)
+            if model_class == "chat_default":
+                # GPT-5.2 chat-latest uses default settings (no user tuning).
+                reasoning_effort = None
+                temperature = None
+            elif model_class == "gpt5_reasoning":
+                # GPT-5 models use reasoning effort instead of temperature.
+                effort_options = get_reasoning_effort_options(model_name) or [
+                    DEFAULT_REASONING_EFFORT
+                ]
+                reasoning_effort = st.selectbox(
+                    "Reasoning effort",
+                    options=effort_options,
+                    index=(
+                        effort_options.index(DEFAULT_REASONING_EFFORT)
+                        if DEFAULT_REASONING_EFFORT in effort_options
+                        else 0
+                    ),
+                )
+                temperature = None
+            else:
+                # Keep temperature tuning for non-GPT-5 models.
+                temperature = st.slider(
+                    "Temperature",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=0.2,
+                    step=0.05,
+                )
+                reasoning_effort = None
+
+        # Smaller single-line prompt lets Enter submit the form.
+        user_prompt = st.text_input(
+            "User Prompt (optional)",
+            placeholder="e.g., Focus on backend APIs and system design.",
+        )
+
+        # Center the submit button at the bottom of the form.
+        _, button_col, _ = st.columns((1, 1, 1))
+        generate_clicked = button_col.form_submit_button(
+            "Generate 5 Questions", type="primary"
+        )
+
+    st.divider()
+    if generate_clicked:
+        # Capture a request-level log entry without exposing user content.
+        # Skip building the metadata dict entirely when INFO logging is disabled.
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                f"{log_prefix}_generate_clicked",
+                extra={
+                    "job_description_length": len(job_description),
+                    "cv_text_length": len(cv_text),
+                    "user_prompt_length": len(user_prompt),
+                    "selected_variant": selected_label,
+                    "selected_variant_id": selected_variant_id,
+                    "temperature": temperature if temperature is not None else "default",
+                    "reasoning_effort": reasoning_effort or "default",
+                    "model_name": model_name,
+                },
+            )
+        # Build the payload once so the controller gets a stable snapshot.
+        payload = _build_payload(
+            job_description=job_description,
+            cv_text=cv_text,
+            user_prompt=user_prompt,
+            prompt_variant_id=selected_variant_id,
+            temperature=temperature,
+            model_name=model_name,
+            reasoning_effort=reasoning_effort,
+        )
+        result_key = f"{form_key}_last_result"
+        duplicate_result = _recent_duplicate_result(st.session_state, result_key, payload)
+        if duplicate_result is not None:
+            # Re-render the result of an accidental double submit instead of calling again.
+            _LOGGER.info(f"{log_prefix}_duplicate_submit")
+            ok, response = duplicate_result
+        else:
+            # Rate limit per session to prevent accidental rapid-fire requests.
+            rate_limit_key = st.session_state.get("rate_limit_key")
+            if rate_limit_key is None:
+                rate_limit_key = st.session_state["rate_limit_key"] = secrets.token_hex(8)
+            ok, refusal = check_rate_limit(rate_limit_key)
+            if not ok:
+                _LOGGER.info(f"{log_prefix}_rate_limited")
+                st.error(refusal or "Too many requests. Please try again.")
+                return
+
+            # Show a spinner while the model call runs.
+            with st.spinner("Generating questions..."):
+                ok, response = generate_questions(payload)
+                # Store before any further UI call so an interrupting resubmit can reuse it.
+                st.session_state[result_key] = (payload, time.monotonic(), (ok, response))
+
+        if not ok:
+            # Surface safety refusals or validation errors to the user.
+            _LOGGER.info(f"{log_prefix}_request_blocked")
+            st.error(response)
+            return
+
+        # Render the structured response returned by the controller.
+        st.subheader("Generated Questions")
+        if isinstance(response, dict):
+            # Convert structured output into readable markdown for display.
+            st.markdown(render_markdown_from_response(response))
+        else:
+            st.markdown(response)
+
+        # Echo metadata so users can reproduce results.
+        if temperature is None:
+            st.caption(
+                f"Model: {model_name} | Prompt variant: {selected_label} | "
+                f"Reasoning effort: {reasoning_effort or 'default'}"
+            )
+        else:
+            st.caption(
+                f"Model: {model_name} | Prompt variant: {selected_label} | "
+                f"Temperature: {temperature:.2f}"
+            )
+        _LOGGER.info(f"{log_prefix}_request_success")
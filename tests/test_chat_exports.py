@@ -26,3 +26,16 @@ def test_build_chat_pdf_bytes_handles_empty_history():
     pdf_bytes = build_chat_pdf_bytes([])
     assert pdf_bytes.startswith(b"%PDF")
 
+
+def test_chat_exports_import_defers_markdown_pdf():
+    """Verify importing the export helpers does not load markdown-pdf eagerly."""
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    code = (
+        "import sys, app.core.chat_exports; "
+        "sys.exit(1 if 'markdown_pdf' in sys.modules else 0)"
+    )
+    repo_root = Path(__file__).parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=repo_root).returncode == 0
@@ -3,6 +3,7 @@
 from app.core.chat_history import (
     ChatMessage,
     append_chat_message,
+    compute_trim_start,
     init_chat_history,
     trim_chat_history,
 )
@@ -48,3 +49,32 @@ def test_trim_chat_history_enforces_max_chars():
 
     assert [message.content for message in messages] == ["67890", "abc"]
     assert sum(len(message.content) for message in messages) <= 10
+
+
+def test_compute_trim_start_keeps_newest_messages_within_budget():
+    """Verify the trim start keeps the longest suffix that fits max chars."""
+    messages = [
+        ChatMessage(role="user", content="x" * length)
+        for length in (7, 3, 12, 0, 5, 4)
+    ]
+
+    assert compute_trim_start(messages, max_chars=100) == 0
+    assert compute_trim_start(messages, max_chars=9) == 3
+    assert compute_trim_start(messages, max_chars=4) == 5
+    assert compute_trim_start(messages, max_chars=-1) == 6
+    # Trimming in place drops exactly the prefix before the computed start.
+    trim_chat_history(messages, max_chars=9)
+    assert [len(message.content) for message in messages] == [0, 5, 4]
+
+
+def test_chat_message_is_immutable_and_slotted():
+    """Verify chat messages cannot be mutated and carry no instance dict."""
+    import dataclasses
+
+    import pytest
+
+    message = ChatMessage(role="user", content="hello")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        message.content = "changed"
+    assert not hasattr(message, "__dict__")
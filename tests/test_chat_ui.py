@@ -11,3 +11,372 @@ def test_chat_ui_import_smoke():
     pytest.importorskip("streamlit")
     # Ensure the module imports without side effects or errors.
     importlib.import_module("app.ui.openai_chat_ui")
+
+
+def test_cached_variant_labels_map_display_names_to_ids():
+    """Verify chat variant labels are built once and keep catalog order."""
+    pytest.importorskip("streamlit")
+    from app.core.prompts import get_chat_prompt_variants
+    from app.ui.chat_ui_common import _cached_variant_labels
+
+    variants = tuple(get_chat_prompt_variants())
+    labels = _cached_variant_labels(variants)
+
+    assert list(labels.values()) == [variant.id for variant in variants]
+    assert "Mock Interview (realistic live)" in labels
+    assert _cached_variant_labels(variants) is labels
+
+
+def test_sync_transcript_lines_appends_only_new_turns():
+    """Verify cached transcript lines grow incrementally and match full serialization."""
+    pytest.importorskip("streamlit")
+    from app.core.chat_history import ChatMessage
+    from app.ui.chat_ui_common import (
+        _build_prompt_history,
+        _sync_transcript_lines,
+    )
+
+    state: dict = {}
+    messages = [
+        ChatMessage(role="user", content="12345"),
+        ChatMessage(role="assistant", content="67890"),
+    ]
+    lines = _sync_transcript_lines(state, "transcript", messages)
+    assert lines == ["User: 12345", "Assistant: 67890"]
+
+    messages.append(ChatMessage(role="user", content="abc"))
+    assert _sync_transcript_lines(state, "transcript", messages) is lines
+    assert lines[-1] == "User: abc"
+
+    # Trimmed prompts reuse the cached lines and match the uncached serialization.
+    assert _build_prompt_history(messages, 10, transcript_lines=lines) == (
+        _build_prompt_history(messages, 10)
+    )
+    assert _build_prompt_history(messages, 10, transcript_lines=lines) == (
+        "Assistant: 67890\nUser: abc"
+    )
+
+
+def test_render_message_body_picks_renderer_and_collapses_large_text():
+    """Verify plain text skips markdown and oversized responses start collapsed."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _COLLAPSE_RESPONSE_CHARS, _render_message_body
+
+    class _Target:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, str]] = []
+
+        def markdown(self, body: str) -> None:
+            self.calls.append(("markdown", body))
+
+        def text(self, body: str) -> None:
+            self.calls.append(("text", body))
+
+        def expander(self, label: str) -> "_Target":
+            self.calls.append(("expander", label))
+            return self
+
+    target = _Target()
+    _render_message_body("Plain reply", target)
+    _render_message_body("Use **bold**", target)
+    _render_message_body("a" * (_COLLAPSE_RESPONSE_CHARS + 1), target)
+
+    assert [kind for kind, _ in target.calls] == ["text", "markdown", "expander", "text"]
+
+
+def test_stream_renderer_redraws_only_the_growing_block(monkeypatch):
+    """Verify completed blocks render once and open code fences are not split."""
+    pytest.importorskip("streamlit")
+    import app.ui.chat_ui_common as chat_ui_common
+
+    assert chat_ui_common._stable_block_end("one\n\ntwo") == 3
+    assert chat_ui_common._stable_block_end("one\n\n```\na\n\nb") == 3
+    assert chat_ui_common._stable_block_end("no break yet") == 0
+
+    class _Slot:
+        def __init__(self) -> None:
+            self.bodies: list[str] = []
+
+        def markdown(self, body: str) -> None:
+            self.bodies.append(body)
+
+    class _Container:
+        def __init__(self) -> None:
+            self.slots: list[_Slot] = []
+
+        def empty(self) -> _Slot:
+            self.slots.append(_Slot())
+            return self.slots[-1]
+
+    class _Placeholder:
+        def __init__(self) -> None:
+            self.blocks = _Container()
+
+        def container(self) -> _Container:
+            return self.blocks
+
+    monkeypatch.setattr(chat_ui_common, "_STREAM_FLUSH_INTERVAL_SECONDS", 0.0)
+    placeholder = _Placeholder()
+    on_delta = chat_ui_common._build_stream_renderer(placeholder)
+    for delta in ("Intro", "\n\nSecond", " part", "\n\nThird"):
+        on_delta(delta)
+
+    completed_slot, pending_slot = placeholder.blocks.slots
+    assert completed_slot.bodies == ["Intro", "Intro\n\nSecond part"]
+    assert pending_slot.bodies[-1] == "\n\nThird"
+
+
+def test_default_model_index_matches_catalog_default():
+    """Verify the precomputed default model index points at the catalog default."""
+    pytest.importorskip("streamlit")
+    from app.core.model_catalog import DEFAULT_MODEL
+    from app.ui.chat_ui_common import _ALLOWED_MODELS, _DEFAULT_MODEL_INDEX
+
+    assert _ALLOWED_MODELS[_DEFAULT_MODEL_INDEX] == DEFAULT_MODEL
+
+
+def test_queue_chat_input_drops_duplicate_submissions():
+    """Verify an identical resubmission inside the debounce window is ignored."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _consume_chat_input, _queue_chat_input
+
+    state: dict = {"widget": "hello"}
+    keys = {
+        "chat_input_widget_key": "widget",
+        "pending_input_key": "pending",
+        "last_submit_key": "last_submit",
+    }
+
+    _queue_chat_input(state, **keys)
+    assert _consume_chat_input(state, "pending", None) == "hello"
+
+    _queue_chat_input(state, **keys)
+    assert "pending" not in state
+
+    state["widget"] = "different"
+    _queue_chat_input(state, **keys)
+    assert state["pending"] == "different"
+
+
+def test_settings_fingerprint_tracks_snapshot_values():
+    """Verify the settings fingerprint changes only when a setting changes."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _build_settings_snapshot, _settings_fingerprint
+
+    settings = {
+        "selected_label": "Coach",
+        "selected_variant_id": 1,
+        "model_name": "gpt-4o-mini",
+        "temperature": 0.2,
+        "reasoning_effort": None,
+    }
+    fingerprint = _settings_fingerprint(_build_settings_snapshot(**settings))
+
+    assert _settings_fingerprint(_build_settings_snapshot(**settings)) == fingerprint
+    changed = _build_settings_snapshot(**{**settings, "temperature": 0.7})
+    assert _settings_fingerprint(changed) != fingerprint
+
+
+def test_settings_change_note_lists_active_settings():
+    """Verify the settings note lists each setting from the snapshot."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _build_settings_change_note, _build_settings_snapshot
+
+    note = _build_settings_change_note(
+        _build_settings_snapshot(
+            selected_label="Coach",
+            selected_variant_id=1,
+            model_name="gpt-5-nano",
+            temperature=None,
+            reasoning_effort="low",
+        )
+    )
+
+    assert note.startswith("[Configuration update for this response]\n")
+    assert "- Interview style: Coach\n- Model: gpt-5-nano\n" in note
+    assert "- Temperature: default\n- Reasoning effort: low\n" in note
+
+
+def test_assemble_prompt_skips_empty_sections():
+    """Verify prompt sections join in order and empty notes are dropped."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _assemble_prompt
+
+    assert _assemble_prompt(("", "[Current date: May 1, 2026]", "User: Hi")) == (
+        "[Current date: May 1, 2026]\n\nUser: Hi"
+    )
+    assert _assemble_prompt(("note", "")) == "note"
+
+
+def test_format_current_date_note_drops_leading_zero():
+    """Verify the date note spells the month and omits day zero-padding."""
+    pytest.importorskip("streamlit")
+    from datetime import date
+
+    from app.ui.chat_ui_common import _format_current_date_note
+
+    assert _format_current_date_note(date(2026, 3, 5)) == "[Current date: March 5, 2026]"
+    assert _format_current_date_note(date(2026, 11, 20)) == "[Current date: November 20, 2026]"
+
+
+def test_model_settings_spec_selects_widget_per_model():
+    """Verify each model family maps to the right settings widget."""
+    pytest.importorskip("streamlit")
+    from app.core.model_catalog import DEFAULT_REASONING_EFFORT
+    from app.ui.chat_ui_common import _model_settings_spec
+
+    assert _model_settings_spec("gpt-5.2-chat-latest")[0] == "none"
+    assert _model_settings_spec("gpt-4o-mini") == ("temperature", (), 0)
+    kind, options, default_index = _model_settings_spec("gpt-5-nano")
+    assert kind == "effort"
+    assert options[default_index] == DEFAULT_REASONING_EFFORT
+
+
+def test_script_json_escapes_closing_tags():
+    """Verify copy-button payloads cannot terminate their inline script."""
+    pytest.importorskip("streamlit")
+    import json
+
+    from app.ui.chat_ui_common import _script_json
+
+    encoded = _script_json('Grüße </script><script>alert("x")</script>')
+
+    assert "</" not in encoded
+    assert json.loads(encoded) == 'Grüße </script><script>alert("x")</script>'
+
+
+def test_cached_pdfs_reuse_bytes_for_unchanged_content(monkeypatch):
+    """Verify PDF exports are only rebuilt when their content changes."""
+    pytest.importorskip("streamlit")
+    from app.ui import chat_ui_common
+
+    builds: list[str] = []
+
+    def _fake_response_pdf(content: str) -> bytes:
+        builds.append(content)
+        return b"%PDF-" + content.encode()
+
+    monkeypatch.setattr(chat_ui_common, "build_response_pdf_bytes", _fake_response_pdf)
+    chat_ui_common._cached_response_pdf.cache_clear()
+
+    first = chat_ui_common._cached_response_pdf("Reply one")
+    assert chat_ui_common._cached_response_pdf("Reply one") is first
+    chat_ui_common._cached_response_pdf("Reply two")
+
+    assert builds == ["Reply one", "Reply two"]
+    chat_ui_common._cached_response_pdf.cache_clear()
+
+
+def test_recent_assistant_start_finds_oldest_recent_turn():
+    """Verify the inline-actions cutoff covers only the latest assistant turns."""
+    pytest.importorskip("streamlit")
+    from app.core.chat_history import ChatMessage
+    from app.ui.chat_ui_common import _recent_assistant_start
+
+    roles = ["user", "assistant", "user", "assistant", "assistant", "user", "assistant"]
+    messages = [ChatMessage(role=role, content="x") for role in roles]
+
+    assert _recent_assistant_start(messages, 1) == 6
+    assert _recent_assistant_start(messages, 3) == 3
+    assert _recent_assistant_start(messages, 10) == 0
+
+
+def test_prompt_window_start_holds_until_overflow():
+    """Verify the prompt window keeps its oldest turn until the high mark is passed."""
+    pytest.importorskip("streamlit")
+    from app.core.chat_history import ChatMessage
+    from app.ui.chat_ui_common import _prompt_window_start
+
+    messages = [ChatMessage(role="user", content="x" * 30) for _ in range(3)]
+    assert _prompt_window_start(messages, 0, high_chars=100, low_chars=60) == 0
+
+    messages.append(ChatMessage(role="assistant", content="y" * 30))
+    assert _prompt_window_start(messages, 0, high_chars=100, low_chars=60) == 2
+
+    messages.append(ChatMessage(role="user", content="z" * 90))
+    assert _prompt_window_start(messages, 2, high_chars=100, low_chars=60) == 4
+    assert _prompt_window_start(messages, 99, high_chars=1000, low_chars=60) == 0
+
+
+def test_history_render_start_windows_long_sessions():
+    """Verify only the newest turns render until full history is requested."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _HISTORY_RENDER_WINDOW, _history_render_start
+
+    assert _history_render_start(5, False) == 0
+    assert _history_render_start(_HISTORY_RENDER_WINDOW + 7, False) == 7
+    assert _history_render_start(_HISTORY_RENDER_WINDOW + 7, True) == 0
+
+
+def test_copy_button_template_embeds_escaped_payload(monkeypatch):
+    """Verify the copy button HTML embeds the label and escaped content."""
+    pytest.importorskip("streamlit")
+    from app.ui import chat_ui_common
+
+    rendered: list[str] = []
+    monkeypatch.setattr(
+        chat_ui_common.components, "html", lambda html, height: rendered.append(html)
+    )
+
+    chat_ui_common._render_copy_button(
+        label="Copy response", content="100% </script>", element_key="k"
+    )
+
+    assert 'button.textContent = "Copy response";' in rendered[0]
+    assert 'writeText("100% <\\/script>")' in rendered[0]
+
+
+def test_collapsed_message_actions_skip_copy_iframe(monkeypatch):
+    """Verify collapsed assistant actions show a code block only on demand, never an iframe."""
+    pytest.importorskip("streamlit")
+    from app.core.chat_history import ChatMessage
+    from app.ui import chat_ui_common
+
+    calls: list[str] = []
+    show_copy_text = False
+    monkeypatch.setattr(chat_ui_common.components, "html", lambda *a, **k: calls.append("html"))
+    monkeypatch.setattr(chat_ui_common.st, "toggle", lambda *a, **k: show_copy_text)
+    monkeypatch.setattr(chat_ui_common.st, "code", lambda *a, **k: calls.append("code"))
+    monkeypatch.setattr(
+        chat_ui_common.st, "download_button", lambda *a, **k: calls.append("download")
+    )
+    message = ChatMessage(role="assistant", content="Older reply")
+
+    def _render() -> bool:
+        return chat_ui_common._render_assistant_message_actions(
+            message=message,
+            message_index=1,
+            latest_assistant_index=9,
+            all_messages=[message],
+            state_key_prefix="chat",
+            collapsed=True,
+        )
+
+    assert _render() is False
+    assert calls == ["download"]
+
+    calls.clear()
+    show_copy_text = True
+    assert _render() is False
+    assert calls == ["code", "download"]
+
+
+def test_looks_like_cover_letter_needs_two_distinct_markers():
+    """Verify cover letter detection counts distinct markers case-insensitively."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _looks_like_cover_letter
+
+    assert _looks_like_cover_letter("SEHR GEEHRTE Damen,\n\nMit freundlichen Grüßen")
+    assert _looks_like_cover_letter("Meine Bewerbung als [Position]")
+    assert not _looks_like_cover_letter("Bewerbung, Bewerbung, Bewerbung")
+    assert not _looks_like_cover_letter("Here is feedback on your answer.")
+
+
+def test_is_mock_interview_request_matches_case_insensitively():
+    """Verify interview-mode phrases are detected regardless of case."""
+    pytest.importorskip("streamlit")
+    from app.ui.chat_ui_common import _is_mock_interview_request
+
+    assert _is_mock_interview_request("Please START A MOCK round")
+    assert _is_mock_interview_request("Can you interview me?")
+    assert not _is_mock_interview_request("Improve my cover letter")
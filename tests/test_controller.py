@@ -92,7 +92,9 @@ def test_generate_chat_response_returns_text(monkeypatch):
         return True, None
 
     # Fake the chat completion to keep the test deterministic.
-    def _fake_chat_completion(messages, temperature, model_name=None, reasoning_effort=None):
+    def _fake_chat_completion(
+        messages, temperature, model_name=None, reasoning_effort=None, on_delta=None
+    ):
         assert messages
         assert temperature == 0.3
         return True, "Coach reply"
@@ -154,7 +156,9 @@ def test_generate_cover_letter_success_path(monkeypatch):
         return True, None
 
     # Fake the chat completion to keep the test deterministic.
-    def _fake_chat_completion(messages, temperature, model_name=None, reasoning_effort=None):
+    def _fake_chat_completion(
+        messages, temperature, model_name=None, reasoning_effort=None, on_delta=None
+    ):
         assert messages
         return True, "Sehr geehrte Damen und Herren,\n\nTest.\n"
 
@@ -184,7 +188,9 @@ def test_generate_chat_summary_success_path(monkeypatch):
         return True, None
 
     # Fake the chat completion to keep the test deterministic.
-    def _fake_chat_completion(messages, temperature, model_name=None, reasoning_effort=None):
+    def _fake_chat_completion(
+        messages, temperature, model_name=None, reasoning_effort=None, on_delta=None
+    ):
         assert messages
         return True, "## Summary\n- Key point"
 
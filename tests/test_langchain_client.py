@@ -25,6 +25,26 @@ class _DummyChatOpenAI:
         return _DummyLangchainResponse(self.next_response)
 
 
+class _DummyLangchainChunk:
+    # Message chunk stand-in that merges a list of chunks like AIMessageChunk.
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    def __add__(self, others: list["_DummyLangchainChunk"]) -> "_DummyLangchainChunk":
+        return _DummyLangchainChunk(self.content + "".join(other.content for other in others))
+
+
+class _DummyStreamingChatOpenAI:
+    # Stand-in ChatOpenAI client that streams preset text deltas.
+    next_deltas: tuple[str, ...] = ()
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+
+    def stream(self, messages: list[object]):
+        yield from (_DummyLangchainChunk(delta) for delta in self.next_deltas)
+
+
 def test_generate_langchain_completion_returns_text(monkeypatch):
     """Verify LangChain wrapper returns raw text."""
     # Capture client construction for later assertions.
@@ -293,3 +313,55 @@ def test_generate_langchain_cover_letter_requires_jd_cv(monkeypatch):
 
     assert ok is False
     assert "job description" in message
+
+
+def test_generate_langchain_chat_response_streams_deltas(monkeypatch):
+    """Verify LangChain chat streaming forwards deltas and returns sanitized text."""
+    # Stream preset deltas through the shared fake client.
+    monkeypatch.setattr(
+        _DummyStreamingChatOpenAI, "next_deltas", ("Hello ", "<user-job-ab12>", "there")
+    )
+    monkeypatch.setattr(langchain_client, "ChatOpenAI", _DummyStreamingChatOpenAI)
+
+    payload = RequestPayload(
+        job_description="JD",
+        cv_text="CV",
+        user_prompt="User prompt",
+        prompt_variant_id=101,
+        temperature=0.2,
+    )
+    deltas: list[str] = []
+
+    ok, result = langchain_client.generate_langchain_chat_response(
+        payload, on_delta=deltas.append
+    )
+
+    assert ok is True
+    assert deltas == ["Hello ", "<user-job-ab12>", "there"]
+    assert result == "Hello there"
+
+
+def test_generate_langchain_cover_letter_response_streams_deltas(monkeypatch):
+    """Verify LangChain cover letters stream deltas like chat replies."""
+    # Stream preset deltas through the shared fake client.
+    monkeypatch.setattr(
+        _DummyStreamingChatOpenAI, "next_deltas", ("Sehr geehrte ", "Damen und Herren")
+    )
+    monkeypatch.setattr(langchain_client, "ChatOpenAI", _DummyStreamingChatOpenAI)
+
+    payload = RequestPayload(
+        job_description="JD",
+        cv_text="CV",
+        user_prompt="User prompt",
+        prompt_variant_id=101,
+        temperature=0.2,
+    )
+    deltas: list[str] = []
+
+    ok, result = langchain_client.generate_langchain_cover_letter_response(
+        payload, on_delta=deltas.append
+    )
+
+    assert ok is True
+    assert deltas == ["Sehr geehrte ", "Damen und Herren"]
+    assert result == "Sehr geehrte Damen und Herren"
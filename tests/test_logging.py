@@ -135,3 +135,27 @@ def test_setup_logging_creates_console_handler():
         for handler in original_handlers:
             root_logger.addHandler(handler)
         root_logger.setLevel(original_level)
+
+
+def test_setup_logging_skips_reconfiguration_on_repeat_calls():
+    """Verify repeat setup calls with the same level leave handlers untouched."""
+    root_logger = logging.getLogger()
+    original_handlers = list(root_logger.handlers)
+    original_level = root_logger.level
+    try:
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        setup_logging("WARNING")
+        handler = root_logger.handlers[0]
+        # Simulate a later tweak that a rerun should not overwrite.
+        handler.setLevel(logging.DEBUG)
+        setup_logging("WARNING")
+        assert root_logger.handlers == [handler]
+        assert handler.level == logging.DEBUG
+    finally:
+        # Restore original handlers and level to avoid side effects on other tests.
+        for handler in list(root_logger.handlers):
+            root_logger.removeHandler(handler)
+        for handler in original_handlers:
+            root_logger.addHandler(handler)
+        root_logger.setLevel(original_level)
@@ -1,6 +1,11 @@
 """Tests for model catalog helpers."""
 
-from app.core.model_catalog import DEFAULT_MODEL, get_allowed_models, get_reasoning_effort_options
+from app.core.model_catalog import (
+    DEFAULT_MODEL,
+    get_allowed_models,
+    get_model_class,
+    get_reasoning_effort_options,
+)
 
 
 def test_get_allowed_models_returns_expected_list():
@@ -27,3 +32,11 @@ def test_get_reasoning_effort_options_for_gpt5():
         "high",
     ]
     assert get_reasoning_effort_options("gpt-5.2-chat-latest") == []
+
+
+def test_get_model_class_groups_models_by_tuning_controls():
+    """Verify get model class groups models by their tuning controls."""
+    # Chat-latest takes no tuning, GPT-5 nano takes effort, others take temperature.
+    assert get_model_class("gpt-5.2-chat-latest") == "chat_default"
+    assert get_model_class("gpt-5-nano") == "gpt5_reasoning"
+    assert get_model_class("gpt-4o-mini") == "standard"
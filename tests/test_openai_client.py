@@ -2,7 +2,7 @@
 
 from app.core.llm import openai_client
 from app.core.model_catalog import get_allowed_models, get_reasoning_effort_options
-from app.core.structured_output import STRUCTURED_OUTPUT_SCHEMA
+from app.core.structured_output import get_schema_dict
 
 
 class _DummyMessage:
@@ -80,7 +80,7 @@ def test_generate_completion_builds_payload(monkeypatch):
     assert last_kwargs["messages"] == messages
     assert last_kwargs["temperature"] == 0.4
     assert last_kwargs["response_format"]["type"] == "json_schema"
-    assert last_kwargs["response_format"]["json_schema"] == STRUCTURED_OUTPUT_SCHEMA
+    assert last_kwargs["response_format"]["json_schema"] == get_schema_dict()
 
 
 def test_generate_completion_uses_model_override(monkeypatch):
@@ -196,6 +196,31 @@ def test_generate_chat_completion_omits_response_format(monkeypatch):
     assert last_kwargs["temperature"] == 0.1
 
 
+def test_requests_reuse_one_client(monkeypatch):
+    """Verify repeated requests reuse one client and its connection pool."""
+    # Track client creation across several calls.
+    created_clients: list[_DummyOpenAI] = []
+
+    def _factory():
+        return _DummyOpenAI(created_clients)
+
+    monkeypatch.setattr(openai_client, "OpenAI", _factory)
+    messages = [
+        {"role": "system", "content": "system"},
+        {"role": "user", "content": "user"},
+    ]
+
+    for _ in range(3):
+        ok, _result = openai_client.generate_chat_completion(
+            messages, temperature=0.2, model_name="gpt-4o-mini"
+        )
+        assert ok is True
+
+    assert len(created_clients) == 1
+    # Moderation and other callers get the same cached client.
+    assert openai_client.get_openai_client() is created_clients[0]
+
+
 def test_gpt5_models_accept_reasoning_effort_options(monkeypatch):
     """Verify gpt5 models accept reasoning effort options."""
     # Track client creation so we can inspect each request payload.
@@ -252,3 +277,47 @@ def test_chat_latest_ignores_reasoning_effort(monkeypatch):
     last_kwargs = created_clients[-1].chat.completions.last_kwargs
     assert last_kwargs["model"] == "gpt-5.2-chat-latest"
     assert "reasoning_effort" not in last_kwargs
+
+
+def test_generate_chat_completion_streams_deltas(monkeypatch):
+    """Verify streamed chat completions forward deltas and return the full text."""
+
+    class _Delta:
+        def __init__(self, content: str | None) -> None:
+            self.content = content
+            self.refusal = None
+
+    class _StreamChoice:
+        def __init__(self, content: str | None) -> None:
+            self.delta = _Delta(content)
+
+    class _StreamChunk:
+        def __init__(self, content: str | None) -> None:
+            self.choices = [_StreamChoice(content)]
+
+    class _StreamingCompletions(_DummyCompletions):
+        def create(self, **kwargs):
+            self.last_kwargs = kwargs
+            return iter([_StreamChunk("Hel"), _StreamChunk(None), _StreamChunk("lo")])
+
+    created_clients: list[_DummyOpenAI] = []
+
+    def _factory():
+        client = _DummyOpenAI(created_clients)
+        client.chat.completions = _StreamingCompletions()
+        return client
+
+    monkeypatch.setattr(openai_client, "OpenAI", _factory)
+    deltas: list[str] = []
+
+    ok, result = openai_client.generate_chat_completion(
+        [{"role": "user", "content": "user"}],
+        temperature=0.1,
+        model_name=get_allowed_models()[0],
+        on_delta=deltas.append,
+    )
+
+    assert ok is True
+    assert result == "Hello"
+    assert deltas == ["Hel", "lo"]
+    assert created_clients[0].chat.completions.last_kwargs["stream"] is True
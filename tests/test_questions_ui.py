@@ -0,0 +1,53 @@
+"""Tests for the shared question generator UI helpers."""
+
+import importlib
+
+import pytest
+
+from app.core.dataclasses import RequestPayload
+
+
+def _payload(user_prompt: str) -> RequestPayload:
+    return RequestPayload(
+        job_description="JD",
+        cv_text="CV",
+        user_prompt=user_prompt,
+        prompt_variant_id=1,
+        temperature=0.2,
+    )
+
+
+def test_questions_ui_import_smoke():
+    """Verify questions ui import smoke."""
+    # Skip when Streamlit isn't installed so CI stays green.
+    pytest.importorskip("streamlit")
+    # Ensure both page wrappers import without side effects or errors.
+    importlib.import_module("app.ui.openai_questions_ui")
+    importlib.import_module("app.ui.langchain_questions_ui")
+
+
+def test_recent_duplicate_result_reuses_only_fresh_identical_payloads(monkeypatch):
+    """Verify a double submit reuses the stored result only inside the window."""
+    pytest.importorskip("streamlit")
+    from app.ui import questions_ui_common
+
+    monkeypatch.setattr(questions_ui_common.time, "monotonic", lambda: 100.0)
+    state = {"form_last_result": (_payload("APIs"), 99.5, (True, "questions"))}
+
+    assert questions_ui_common._recent_duplicate_result(
+        state, "form_last_result", _payload("APIs")
+    ) == (True, "questions")
+    assert (
+        questions_ui_common._recent_duplicate_result(state, "form_last_result", _payload("SQL"))
+        is None
+    )
+    assert (
+        questions_ui_common._recent_duplicate_result({}, "form_last_result", _payload("APIs"))
+        is None
+    )
+
+    monkeypatch.setattr(questions_ui_common.time, "monotonic", lambda: 105.0)
+    assert (
+        questions_ui_common._recent_duplicate_result(state, "form_last_result", _payload("APIs"))
+        is None
+    )
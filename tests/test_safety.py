@@ -7,6 +7,7 @@ from app.core.safety import (
     MAX_USER_PROMPT_LENGTH,
     check_rate_limit,
     record_safety_event,
+    redact_partial_output,
     sanitize_output,
     validate_output,
     validate_chat_inputs,
@@ -262,6 +263,21 @@ def test_sanitize_output_logs_event(monkeypatch):
     assert "output_sanitized" in events
 
 
+def test_redact_partial_output_holds_back_partial_tag(monkeypatch):
+    """Verify streamed output hides tags, including unfinished ones."""
+    events: list[str] = []
+
+    def _record(event_type: str, _: dict | None = None) -> None:
+        events.append(event_type)
+
+    monkeypatch.setattr("app.core.safety.record_safety_event", _record)
+
+    assert redact_partial_output("Hi <user-job-ac") == "Hi "
+    assert redact_partial_output("Hi <user-job-ac>there") == "Hi there"
+    assert redact_partial_output("a < b") == "a < b"
+    assert events == []
+
+
 def test_check_rate_limit_blocks_after_threshold():
     """Verify check rate limit blocks after threshold."""
     # A key should be blocked after exceeding the limit within the window.
@@ -287,6 +303,33 @@ def test_check_rate_limit_allows_after_window():
     assert ok is True
 
 
+def test_check_rate_limit_refills_gradually():
+    """Verify check rate limit refills one request per refill interval."""
+    # A drained bucket should not admit a fresh burst right after the window edge.
+    key = "rate-limit-refill-test"
+    for _ in range(5):
+        ok, _ = check_rate_limit(key, now=3000.0)
+        assert ok is True
+
+    ok, _ = check_rate_limit(key, now=3006.0)
+    assert ok is True
+    ok, _ = check_rate_limit(key, now=3006.0)
+    assert ok is False
+
+
+def test_check_rate_limit_sweeps_idle_buckets(monkeypatch):
+    """Verify check rate limit drops buckets of idle sessions."""
+    # Buckets untouched for a full window should not be retained forever.
+    from app.core import safety
+
+    monkeypatch.setattr(safety, "_RATE_LIMIT_LAST_SWEEP", 0.0)
+    check_rate_limit("rate-limit-idle-test", now=4000.0)
+    check_rate_limit("rate-limit-active-test", now=4100.0)
+
+    assert "rate-limit-idle-test" not in safety._RATE_LIMIT_BUCKETS
+    assert "rate-limit-active-test" in safety._RATE_LIMIT_BUCKETS
+
+
 def test_clean_inputs_pass():
     """Verify clean inputs pass."""
     # Clean inputs should pass validation with no refusal message.
@@ -1,6 +1,17 @@
 """Tests for structured output markdown rendering and validation."""
 
-from app.core.structured_output import render_markdown_from_response, validate_structured_response
+import json
+
+import pytest
+
+from app.core.structured_output import (
+    STRUCTURED_OUTPUT_SCHEMA,
+    dumps,
+    get_schema_dict,
+    loads,
+    render_markdown_from_response,
+    validate_structured_response,
+)
 
 
 def test_render_markdown_from_response_builds_sections():
@@ -99,3 +110,98 @@ def test_validate_structured_response_rejects_invalid_cv_note_type():
 
     assert ok is False
     assert message
+
+
+def test_loads_and_dumps_round_trip():
+    """Verify JSON helpers round-trip structured payloads."""
+    payload = {"cv_note": None, "interview_questions": ["[Technical] Question one?"]}
+
+    assert loads(dumps(payload)) == payload
+
+
+def test_loads_raises_stdlib_decode_error_on_invalid_json():
+    """Verify invalid JSON raises the stdlib decode error type."""
+    with pytest.raises(json.JSONDecodeError):
+        loads("not-json")
+
+
+def test_validate_structured_response_accepts_valid_response():
+    """Verify validate structured response accepts a contract-compliant response."""
+    response = {
+        "target_role_context": ["Role summary"],
+        "cv_note": None,
+        "alignments": [],
+        "gaps_or_risk_areas": ["Gap point"],
+        "interview_questions": [
+            "[Technical] Question one?",
+            "[Behavioral] Question two?",
+            "[Role-specific] Question three?",
+            "[Screening] Question four?",
+            "[Onsite] Question five?",
+        ],
+        "next_step_suggestions": ["Next step", "Another step"],
+    }
+
+    assert validate_structured_response(response) == (True, None)
+
+
+def test_validate_structured_response_rejects_untagged_question():
+    """Verify validate structured response rejects questions without a tag."""
+    response = {
+        "target_role_context": ["Role summary"],
+        "cv_note": None,
+        "alignments": [],
+        "gaps_or_risk_areas": ["Gap point"],
+        "interview_questions": [
+            "Question one?",
+            "[Behavioral] Question two?",
+            "[Role-specific] Question three?",
+            "[Screening] Question four?",
+            "[Onsite] Question five?",
+        ],
+        "next_step_suggestions": ["Next step", "Another step"],
+    }
+
+    ok, message = validate_structured_response(response)
+
+    assert ok is False
+    assert "tag" in message
+
+
+def test_validate_structured_response_rejects_unknown_question_tag():
+    """Verify validate structured response rejects tags outside the allowed set."""
+    response = {
+        "target_role_context": ["Role summary"],
+        "cv_note": None,
+        "alignments": [],
+        "gaps_or_risk_areas": ["Gap point"],
+        "interview_questions": [
+            "[Trivia] Question one?",
+            "[Behavioral] Question two?",
+            "[Role-specific] Question three?",
+            "[Screening] Question four?",
+            "[Onsite] Question five?",
+        ],
+        "next_step_suggestions": ["Next step", "Another step"],
+    }
+
+    ok, message = validate_structured_response(response)
+
+    assert ok is False
+    assert "tag" in message
+
+
+def test_structured_output_schema_is_read_only():
+    """Verify the shared schema is frozen at every level and callers get fresh copies."""
+    with pytest.raises(TypeError):
+        STRUCTURED_OUTPUT_SCHEMA["strict"] = False  # type: ignore[index]
+    with pytest.raises(TypeError):
+        STRUCTURED_OUTPUT_SCHEMA["schema"]["properties"]["cv_note"] = {}  # type: ignore[index]
+
+    # Mutating a returned copy must not leak into later requests.
+    schema = get_schema_dict()
+    schema["schema"]["properties"].pop("cv_note")
+    schema["schema"]["required"].append("extra")
+    assert get_schema_dict() is not schema
+    assert "cv_note" in get_schema_dict()["schema"]["properties"]
+    assert "extra" not in get_schema_dict()["schema"]["required"]